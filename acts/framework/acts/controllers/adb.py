@@ -157,7 +157,8 @@ class AdbProxy(object):
         This is specific to executing adb commands.
 
         Args:
-            cmd: A string that is the adb command to execute.
+            cmd: A string that is the adb command to execute, or a list of
+                argv tokens to execute without an intermediate shell.
 
         Returns:
             The stdout of the adb command.
@@ -197,6 +198,19 @@ class AdbProxy(object):
         return self._exec_cmd_nb(' '.join((self.adb_str, name, arg_str)),
                                  **kwargs)
 
+    def forward(self, *args, **kwargs):
+        """Runs an 'adb forward' command as an argv list, without a shell.
+
+        Args:
+            args: Arguments to 'adb forward', e.g. '--remove', 'tcp:1234'.
+                A single string argument is split on whitespace for backwards
+                compatibility with callers passing a full argument string.
+        """
+        if len(args) == 1 and isinstance(args[0], str):
+            args = tuple(args[0].split())
+        cmd = self.adb_str.split() + ['forward'] + list(args)
+        return self._exec_cmd(cmd, **kwargs)
+
     def tcp_forward(self, host_port, device_port):
         """Starts tcp forwarding from localhost to this android device.
 
@@ -239,7 +253,7 @@ class AdbProxy(object):
                 return
             # The actual port we need to disable via adb is on the remote host.
             host_port = remote_port
-        self.forward("--remove tcp:%d" % host_port)
+        self.forward("--remove", "tcp:%d" % host_port)
 
     def getprop(self, prop_name):
         """Get a property of the device.
@@ -255,6 +269,19 @@ class AdbProxy(object):
         """
         return self.shell("getprop %s" % prop_name)
 
+    def getprops(self):
+        """Get all properties of the device.
+
+        This is a convenience wrapper for "adb shell getprop", which dumps
+        every property in a single adb round trip instead of one round trip
+        per property.
+
+        Returns:
+            A dict mapping each property name to its string value.
+        """
+        out = self.shell("getprop")
+        return dict(re.findall(r'^\[(.+?)\]: \[(.*)\]$', out, re.MULTILINE))
+
     # TODO: This should be abstracted out into an object like the other shell
     # command.
     def shell(self, command, ignore_status=False, timeout=DEFAULT_ADB_TIMEOUT):
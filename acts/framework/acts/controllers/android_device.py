@@ -21,6 +21,7 @@ import os
 import re
 import socket
 import time
+import zipfile
 from builtins import open
 from builtins import str
 from datetime import datetime
@@ -64,6 +65,21 @@ WAIT_FOR_DEVICE_TIMEOUT = 180
 ENCRYPTION_WINDOW = "CryptKeeper"
 DEFAULT_DEVICE_PASSWORD = "1111"
 RELEASE_ID_REGEXES = [re.compile(r'\w+\.\d+\.\d+'), re.compile(r'N\w+')]
+# Byte-level version of acts.logger's logline timestamp pattern, used to scan
+# logcat files without decoding them line by line.
+LOGLINE_TIMESTAMP_BYTES_RE = re.compile(
+    rb'\d\d\d\d-\d\d-\d\d \d\d:\d\d:\d\d.\d\d\d')
+# Copy size used when excerpting logcat files, so the excerpt is written
+# with bounded memory regardless of the log size.
+LOG_EXCERPT_CHUNK_BYTES = 1024 * 1024
+# How long cached adb/fastboot device lists stay valid. Listing devices forks
+# a subprocess, and properties like is_bootloader are queried several times
+# per device during setup, so the results are memoized briefly.
+_DEVICE_LIST_CACHE_TTL_SEC = 3
+
+# Maps 'adb'/'fastboot' to a (monotonic timestamp, serial list) tuple for the
+# most recent device listing.
+_device_list_cache = {}
 
 
 def create(configs):
@@ -147,27 +163,38 @@ def get_post_job_info(ads):
 def _start_services_on_ads(ads):
     """Starts long running services on multiple AndroidDevice objects.
 
-    If any one AndroidDevice object fails to start services, cleans up all
-    existing AndroidDevice objects and their services.
+    Services are started on all devices concurrently since each device's
+    startup is dominated by adb/sl4a round trips. If any one AndroidDevice
+    object fails to start services, cleans up all AndroidDevice objects and
+    their services.
 
     Args:
         ads: A list of AndroidDevice objects whose services to start.
     """
-    running_ads = []
-    for ad in ads:
-        running_ads.append(ad)
+
+    def _start_services(ad):
         try:
             ad.start_services()
-        except:
+        except Exception as e:
             ad.log.exception('Failed to start some services, abort!')
-            destroy(running_ads)
-            raise
+            return e
+
+    exceptions = utils.concurrent_exec(_start_services,
+                                       [(ad,) for ad in ads])
+    for exception in exceptions:
+        if exception is not None:
+            destroy(ads)
+            raise exception
 
 
 def _parse_device_list(device_list_str, key):
-    """Parses a byte string representing a list of devices. The string is
+    """Parses a string representing a list of devices. The string is
     generated by calling either adb or fastboot.
 
+    Both str and bytes input are accepted. A bytes blob is scanned directly
+    and only the matched serials are decoded, instead of decoding the whole
+    output up front.
+
     Args:
         device_list_str: Output of adb or fastboot.
         key: The token that signifies a device in device_list_str.
@@ -175,29 +202,77 @@ def _parse_device_list(device_list_str, key):
     Returns:
         A list of android device serial numbers.
     """
-    return re.findall(r"(\S+)\t%s" % key, device_list_str)
+    if isinstance(device_list_str, bytes):
+        tab, newline, key = b'\t', b'\n', key.encode('utf-8')
+        decode = lambda serial: str(serial, 'utf-8')
+    else:
+        tab, newline = '\t', '\n'
+        decode = lambda serial: serial
+    results = []
+    for line in device_list_str.split(newline):
+        tokens = line.strip().split(tab)
+        if len(tokens) == 2 and tokens[1] == key:
+            results.append(decode(tokens[0]))
+    return results
+
+
+def _get_cached_device_list(tool, list_func):
+    """Returns a recent cached device list, refreshing it if it has expired.
+
+    Args:
+        tool: The cache key, either 'adb' or 'fastboot'.
+        list_func: A function that queries the tool and returns a list of
+            device serials.
+
+    Returns:
+        A list of android device serials. Empty if there's none.
+    """
+    cached = _device_list_cache.get(tool)
+    if cached and time.monotonic() - cached[0] < _DEVICE_LIST_CACHE_TTL_SEC:
+        return cached[1]
+    device_list = list_func()
+    _device_list_cache[tool] = (time.monotonic(), device_list)
+    return device_list
+
+
+def invalidate_device_list_cache():
+    """Drops any cached adb/fastboot device lists.
+
+    Called whenever a device's connection state is about to change (reboot,
+    adb restarting as root, controller teardown) so the next listing reflects
+    the new state instead of a stale cache entry.
+    """
+    _device_list_cache.clear()
 
 
 def list_adb_devices():
     """List all android devices connected to the computer that are detected by
     adb.
 
+    Results are cached for _DEVICE_LIST_CACHE_TTL_SEC to avoid forking an adb
+    subprocess for every query.
+
     Returns:
         A list of android device serials. Empty if there's none.
     """
-    out = adb.AdbProxy().devices()
-    return _parse_device_list(out, "device")
+    return _get_cached_device_list(
+        'adb', lambda: _parse_device_list(adb.AdbProxy().devices(), "device"))
 
 
 def list_fastboot_devices():
     """List all android devices connected to the computer that are in in
     fastboot mode. These are detected by fastboot.
 
+    Results are cached for _DEVICE_LIST_CACHE_TTL_SEC to avoid forking a
+    fastboot subprocess for every query.
+
     Returns:
         A list of android device serials. Empty if there's none.
     """
-    out = fastboot.FastbootProxy().devices()
-    return _parse_device_list(out, "fastboot")
+    return _get_cached_device_list(
+        'fastboot',
+        lambda: _parse_device_list(fastboot.FastbootProxy().devices(),
+                                   "fastboot"))
 
 
 def get_instances(serials):
@@ -209,6 +284,9 @@ def get_instances(serials):
     Returns:
         A list of AndroidDevice objects.
     """
+    # Prime the fastboot list cache so the whole batch of constructors
+    # shares a single fastboot invocation for their is_bootloader checks.
+    list_fastboot_devices()
     results = []
     for s in serials:
         results.append(AndroidDevice(s))
@@ -227,6 +305,7 @@ def get_instances_with_configs(configs):
     Returns:
         A list of AndroidDevice objects.
     """
+    list_fastboot_devices()
     results = []
     for c in configs:
         try:
@@ -301,15 +380,25 @@ def get_device(ads, **kwargs):
         matched.
     """
 
-    def _get_device_filter(ad):
-        for k, v in kwargs.items():
-            if not hasattr(ad, k):
-                return False
-            elif getattr(ad, k) != v:
+    _missing = object()
+
+    def _matches(ad, attrs):
+        # A single getattr with a sentinel default covers both the missing-
+        # attribute and the wrong-value case in one lookup.
+        for k, v in attrs.items():
+            if getattr(ad, k, _missing) != v:
                 return False
         return True
 
-    filtered = filter_devices(ads, _get_device_filter)
+    if 'serial' in kwargs:
+        # serial is effectively a unique key, so narrow on it with a single
+        # attribute probe per device before walking any other kwargs.
+        other_attrs = {k: v for k, v in kwargs.items() if k != 'serial'}
+        candidates = [ad for ad in ads if ad.serial == kwargs['serial']]
+        filtered = filter_devices(candidates,
+                                  lambda ad: _matches(ad, other_attrs))
+    else:
+        filtered = filter_devices(ads, lambda ad: _matches(ad, kwargs))
     if not filtered:
         raise ValueError(
             "Could not find a target device that matches condition: %s." %
@@ -342,6 +431,63 @@ def take_bug_reports(ads, test_name, begin_time):
     utils.concurrent_exec(take_br, args)
 
 
+def _search_logcat_timestamp(logcat_file, timestamp, file_size):
+    """Binary-searches a logcat file for the first line at or after a time.
+
+    Logcat files are written in chronological order, so instead of reading
+    the whole file the search bisects on byte offsets with seek/readline,
+    aligning each probe to the start of the first timestamped line at or
+    after the probe offset. Lines without a leading timestamp (e.g. stack
+    trace continuations) are skipped over during alignment. The file is
+    never held in memory; locating a line in a multi-GB log costs O(log N)
+    seeks and a few line reads per probe.
+
+    Args:
+        logcat_file: A logcat file opened in binary mode.
+        timestamp: A logline timestamp as bytes. A value longer than the
+            logline timestamp width never compares equal to a line's
+            timestamp, so appending a byte to a stamp yields the first line
+            strictly after it.
+        file_size: The size of the logcat file in bytes.
+
+    Returns:
+        The byte offset of the first line whose timestamp is at or after the
+        given timestamp. file_size if no such line exists.
+    """
+    timestamp_len = acts_logger.log_line_timestamp_len
+    lo = 0
+    hi = file_size
+    result = file_size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        # Align to the start of the first line at or after mid. Seeking to
+        # the byte before mid and discarding through its newline lands on
+        # mid itself when mid is already a line start.
+        if mid == 0:
+            logcat_file.seek(0)
+            start = 0
+        else:
+            logcat_file.seek(mid - 1)
+            logcat_file.readline()
+            start = logcat_file.tell()
+        # Skip forward over any lines that do not begin with a timestamp.
+        while True:
+            line = logcat_file.readline()
+            if not line or LOGLINE_TIMESTAMP_BYTES_RE.match(line):
+                break
+            start += len(line)
+        if not line or start >= hi:
+            # No timestamped line between mid and hi, so any match is below.
+            hi = mid
+            continue
+        if line[:timestamp_len] >= timestamp:
+            result = start
+            hi = mid
+        else:
+            lo = start + len(line)
+    return result
+
+
 class AndroidDevice:
     """Class representing an android device.
 
@@ -362,6 +508,10 @@ class AndroidDevice:
                   via fastboot.
     """
 
+    # Maps device serial to whether its build supports bugreportz, so the
+    # 'bugreportz -v' probe runs once per device instead of per bug report.
+    _bugreportz_support = {}
+
     def __init__(self, serial='', ssh_connection=None):
         self.serial = serial
         # logging.log_path only exists when this is used in an ACTS test run.
@@ -391,6 +541,9 @@ class AndroidDevice:
         # Device info cache.
         self._user_added_device_info = {}
         self._sdk_api_level = None
+        self._build_info = None
+        self._model = None
+        self._is_adb_root = None
 
     def clean_up(self):
         """Cleans up the AndroidDevice object and releases any resources it
@@ -402,6 +555,7 @@ class AndroidDevice:
         self._services.clear()
         if self._ssh_connection:
             self._ssh_connection.close()
+        invalidate_device_list_cache()
 
     def register_service(self, service):
         """Registers the service on the device. """
@@ -444,17 +598,23 @@ class AndroidDevice:
 
         This is not available if the device is in bootloader mode.
 
+        The result is cached on the instance; the cache is dropped on reboot,
+        where the build can actually change.
+
         Returns:
             A dict with the build info of this Android device, or None if the
             device is in bootloader mode.
         """
+        if self._build_info is not None:
+            return self._build_info
         if self.is_bootloader:
             self.log.error("Device is in fastboot mode, could not get build "
                            "info.")
             return
 
-        build_id = self.adb.getprop("ro.build.id")
-        incremental_build_id = self.adb.getprop("ro.build.version.incremental")
+        props = self.adb.getprops()
+        build_id = props.get("ro.build.id", "")
+        incremental_build_id = props.get("ro.build.version.incremental", "")
         valid_build_id = False
         for regex in RELEASE_ID_REGEXES:
             if re.match(regex, build_id):
@@ -466,8 +626,9 @@ class AndroidDevice:
         info = {
             "build_id": build_id,
             "incremental_build_id": incremental_build_id,
-            "build_type": self.adb.getprop("ro.build.type")
+            "build_type": props.get("ro.build.type")
         }
+        self._build_info = info
         return info
 
     @property
@@ -505,17 +666,27 @@ class AndroidDevice:
     @property
     def is_adb_root(self):
         """True if adb is running as root for this device.
+
+        The result is cached, since rootness only changes through root_adb or
+        a reboot, both of which drop the cache. This keeps repeated checks
+        from issuing an 'id -u' round trip (and its flakiness retry) each
+        time.
         """
-        try:
-            return "0" == self.adb.shell("id -u")
-        except adb.AdbError:
-            # Wait a bit and retry to work around adb flakiness for this cmd.
-            time.sleep(0.2)
-            return "0" == self.adb.shell("id -u")
+        if self._is_adb_root is None:
+            try:
+                self._is_adb_root = "0" == self.adb.shell("id -u")
+            except adb.AdbError:
+                # Wait a bit and retry to work around adb flakiness for this
+                # cmd.
+                time.sleep(0.2)
+                self._is_adb_root = "0" == self.adb.shell("id -u")
+        return self._is_adb_root
 
     @property
     def model(self):
         """The Android code name for the device."""
+        if self._model is not None:
+            return self._model
         # If device is in bootloader mode, get mode name from fastboot.
         if self.is_bootloader:
             out = self.fastboot.getvar("product").strip()
@@ -527,17 +698,20 @@ class AndroidDevice:
                 if len(tokens) > 1:
                     return tokens[1].lower()
             return None
-        model = self.adb.getprop("ro.build.product").lower()
-        if model == "sprout":
-            return model
-        else:
-            return self.adb.getprop("ro.product.name").lower()
+        props = self.adb.getprops()
+        model = props.get("ro.build.product", "").lower()
+        if model != "sprout":
+            model = props.get("ro.product.name", "").lower()
+        self._model = model
+        return model
 
     @property
     def droid(self):
         """Returns the RPC Service of the first Sl4aSession created."""
         if len(self._sl4a_manager.sessions) > 0:
-            session_id = sorted(self._sl4a_manager.sessions.keys())[0]
+            # Only the smallest session id is needed; avoid sorting the
+            # whole key set on every access.
+            session_id = min(self._sl4a_manager.sessions)
             return self._sl4a_manager.sessions[session_id].rpc_client
         else:
             return None
@@ -546,7 +720,7 @@ class AndroidDevice:
     def ed(self):
         """Returns the event dispatcher of the first Sl4aSession created."""
         if len(self._sl4a_manager.sessions) > 0:
-            session_id = sorted(self._sl4a_manager.sessions.keys())[0]
+            session_id = min(self._sl4a_manager.sessions)
             return self._sl4a_manager.sessions[
                 session_id].get_event_dispatcher()
         else:
@@ -612,6 +786,8 @@ class AndroidDevice:
         """
         self.adb.root()
         self.adb.wait_for_device()
+        self._is_adb_root = None
+        invalidate_device_list_cache()
 
     def get_droid(self, handle_event=True):
         """Create an sl4a connection to the device.
@@ -726,25 +902,34 @@ class AndroidDevice:
         tag_len = utils.MAX_FILENAME_LEN - len(out_name)
         out_name = '%s,%s' % (tag[:tag_len], out_name)
         adb_excerpt_path = os.path.join(adb_excerpt_dir, out_name)
-        with open(adb_excerpt_path, 'w', encoding='utf-8') as out:
-            in_file = logcat_path
-            with open(in_file, 'r', encoding='utf-8', errors='replace') as f:
-                while True:
-                    line = None
-                    try:
-                        line = f.readline()
-                        if not line:
-                            break
-                    except:
-                        continue
-                    line_time = line[:acts_logger.log_line_timestamp_len]
-                    if not acts_logger.is_valid_logline_timestamp(line_time):
-                        continue
-                    if self._is_timestamp_in_range(line_time, log_begin_time,
-                                                   log_end_time):
-                        if not line.endswith('\n'):
-                            line += '\n'
-                        out.write(line)
+        # Logline timestamps are fixed-width and zero-padded, so the in-range
+        # check can be done by comparing the raw bytes directly instead of
+        # decoding and parsing each line.
+        begin_stamp = log_begin_time.encode('utf-8')
+        end_stamp = log_end_time.encode('utf-8')
+        with open(adb_excerpt_path, 'wb') as out:
+            with open(logcat_path, 'rb') as f:
+                # Logcat lines are chronological, so binary search for the
+                # first line at begin_time or later and for the first line
+                # past end_time; extending the end stamp by one byte turns
+                # the at-or-after search into a strictly-after one.
+                # Everything in between is one contiguous window, which also
+                # keeps continuation lines (e.g. stack traces) that carry no
+                # timestamp of their own.
+                file_size = os.path.getsize(logcat_path)
+                start = _search_logcat_timestamp(f, begin_stamp, file_size)
+                end = _search_logcat_timestamp(f, end_stamp + b'\xff',
+                                               file_size)
+                # Copy the window in bounded chunks so the excerpt never
+                # requires holding the log in memory.
+                f.seek(start)
+                remaining = end - start
+                while remaining > 0:
+                    chunk = f.read(min(remaining, LOG_EXCERPT_CHUNK_BYTES))
+                    if not chunk:
+                        break
+                    out.write(chunk)
+                    remaining -= len(chunk)
         return adb_excerpt_path
 
     def search_logcat(self, matching_string, begin_time=None):
@@ -922,15 +1107,18 @@ class AndroidDevice:
             begin_time: Epoch time when the test started.
         """
         self.adb.wait_for_device(timeout=WAIT_FOR_DEVICE_TIMEOUT)
-        new_br = True
-        try:
-            stdout = self.adb.shell("bugreportz -v")
-            # This check is necessary for builds before N, where adb shell's ret
-            # code and stderr are not propagated properly.
-            if "not found" in stdout:
+        new_br = AndroidDevice._bugreportz_support.get(self.serial)
+        if new_br is None:
+            new_br = True
+            try:
+                stdout = self.adb.shell("bugreportz -v")
+                # This check is necessary for builds before N, where adb
+                # shell's ret code and stderr are not propagated properly.
+                if "not found" in stdout:
+                    new_br = False
+            except adb.AdbError:
                 new_br = False
-        except adb.AdbError:
-            new_br = False
+            AndroidDevice._bugreportz_support[self.serial] = new_br
         br_path = self.device_log_path
         utils.create_dir(br_path)
         time_stamp = acts_logger.normalize_log_line_timestamp(
@@ -943,13 +1131,25 @@ class AndroidDevice:
         self.wait_for_boot_completion()
         self.log.info("Taking bugreport for %s.", test_name)
         if new_br:
-            out = self.adb.shell("bugreportz", timeout=BUG_REPORT_TIMEOUT)
-            if not out.startswith("OK"):
+            # bugreportz -s streams the zip over the existing adb connection
+            # straight into the destination file, instead of writing a temp
+            # file on the device and pulling it with a second adb call.
+            self.adb.exec_out(
+                'bugreportz -s > "%s"' % full_out_path,
+                timeout=BUG_REPORT_TIMEOUT)
+            if not (os.path.exists(full_out_path)
+                    and zipfile.is_zipfile(full_out_path)):
+                # On failure bugreportz streams an error message instead of
+                # zip data.
+                out = 'no output'
+                try:
+                    with open(full_out_path, 'r', errors='replace') as f:
+                        out = f.read(1024).strip()
+                except OSError:
+                    pass
                 raise errors.AndroidDeviceError(
                     'Failed to take bugreport on %s: %s' % (self.serial, out),
                     serial=self.serial)
-            br_out_path = out.split(':')[1].strip().split()[0]
-            self.adb.pull("%s %s" % (br_out_path, full_out_path))
         else:
             self.adb.bugreport(
                 " > {}".format(full_out_path), timeout=BUG_REPORT_TIMEOUT)
@@ -1147,14 +1347,21 @@ class AndroidDevice:
         self.adb.wait_for_device(timeout=WAIT_FOR_DEVICE_TIMEOUT)
         while time.time() < timeout_start + timeout:
             try:
+                # Wait on the device side instead of polling from the host:
+                # this shell call blocks on the adb socket until
+                # sys.boot_completed is set, so completion is noticed
+                # immediately rather than on a fixed 5 second poll cycle.
+                self.adb.shell(
+                    'while [ -z "$(getprop sys.boot_completed)" ]; '
+                    'do sleep 1; done',
+                    timeout=WAIT_FOR_DEVICE_TIMEOUT)
                 completed = self.adb.getprop("sys.boot_completed")
                 if completed == '1':
                     return
-            except adb.AdbError:
+            except (adb.AdbError, job.TimeoutError):
                 # adb shell calls may fail during certain period of booting
                 # process, which is normal. Ignoring these errors.
-                pass
-            time.sleep(5)
+                time.sleep(1)
         raise errors.AndroidDeviceError(
             'Device %s booting process timed out.' % self.serial,
             serial=self.serial)
@@ -1170,12 +1377,20 @@ class AndroidDevice:
                 if want to bring the device to reboot up to password locking
                 phase. Sl4a checking need the device unlocked after rebooting.
         """
+        # The build and adb rootness may change across a reboot (e.g. after
+        # flashing), so drop those caches along with the device list cache.
+        # The same goes for bugreportz support, which is build-dependent.
+        self._build_info = None
+        self._is_adb_root = None
+        AndroidDevice._bugreportz_support.pop(self.serial, None)
         if self.is_bootloader:
             self.fastboot.reboot()
+            invalidate_device_list_cache()
             return
         self.stop_services()
         self.log.info("Rebooting")
         self.adb.reboot()
+        invalidate_device_list_cache()
 
         timeout_start = time.time()
         timeout = 2 * 60
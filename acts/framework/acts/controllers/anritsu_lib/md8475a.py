@@ -417,6 +417,10 @@ class MD8475A(object):
         try:
             self._sock = socket.create_connection(
                 (self._ipaddr, port_number), timeout=120)
+            # The control protocol is many small request/response
+            # exchanges; disable Nagle so short commands are not held
+            # back waiting for the instrument's delayed ACKs.
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self.send_query("*IDN?", 60)
             self.log.info("Communication with Signaling Tester OK.")
             self.log.info("Opened Socket connection to ({})"
@@ -280,6 +280,7 @@ class IPerfServer(IPerfServerBase):
         self._iperf_command = 'iperf3 -s -J -p {}'.format(self.port)
         self._current_log_file = None
         self._iperf_process = None
+        self._current_log_file_handle = None
 
     @property
     def port(self):
@@ -303,12 +304,14 @@ class IPerfServer(IPerfServerBase):
 
         self._current_log_file = self._get_full_file_path(tag)
 
-        cmd = '{cmd} {extra_flags} > {log_file}'.format(
-            cmd=self._iperf_command,
-            extra_flags=extra_args,
-            log_file=self._current_log_file)
+        cmd = '{cmd} {extra_flags}'.format(
+            cmd=self._iperf_command, extra_flags=extra_args)
 
-        self._iperf_process = utils.start_standing_subprocess(cmd)
+        # Write stdout directly to the log file's descriptor rather than
+        # redirecting through the shell.
+        self._current_log_file_handle = open(self._current_log_file, 'w')
+        self._iperf_process = utils.start_standing_subprocess(
+            cmd, stdout=self._current_log_file_handle)
 
     def stop(self):
         """Stops the iperf server.
@@ -322,6 +325,9 @@ class IPerfServer(IPerfServerBase):
         utils.stop_standing_subprocess(self._iperf_process)
 
         self._iperf_process = None
+        if self._current_log_file_handle:
+            self._current_log_file_handle.close()
+            self._current_log_file_handle = None
         return self._current_log_file
 
 
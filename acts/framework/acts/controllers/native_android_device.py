@@ -66,7 +66,7 @@ class NativeAndroidDeviceError(Exception):
 class NativeAndroidDevice(AndroidDevice):
     def __del__(self):
         if self.h_port:
-            self.adb.forward("--remove tcp:%d" % self.h_port)
+            self.adb.forward("--remove", "tcp:%d" % self.h_port)
 
     def get_droid(self, handle_event=True):
         """Create an sl4n connection to the device.
@@ -130,5 +130,7 @@ class NativeAndroidDevice(AndroidDevice):
             raise bt.SL4NException(("SL4N returned an existing uid for a "
                                     "new session. Abort."))
             return droid
-        self._droid_sessions[droid.uid] = [droid]
+        # Map the uid straight to the droid; wrapping each one in a
+        # single-element list only adds an indirection on every access.
+        self._droid_sessions[droid.uid] = droid
         return droid
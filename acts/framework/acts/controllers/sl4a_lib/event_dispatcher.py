@@ -62,6 +62,9 @@ class EventDispatcher:
         self._event_dict = {}
         self._handlers = {}
         self._lock = threading.RLock()
+        # Notified by the polling thread whenever an event is queued, so
+        # waiters can block on new events instead of sleep-polling.
+        self._event_added = threading.Condition(self._lock)
 
         def _log_formatter(message):
             """Defines the formatting used in the logger."""
@@ -106,14 +109,14 @@ class EventDispatcher:
             if event_name in self._handlers:
                 self.handle_subscribed_event(event_obj, event_name)
             else:
-                self._lock.acquire()
-                if event_name in self._event_dict:  # otherwise, cache event
-                    self._event_dict[event_name].put(event_obj)
-                else:
-                    q = queue.Queue()
-                    q.put(event_obj)
-                    self._event_dict[event_name] = q
-                self._lock.release()
+                with self._event_added:
+                    if event_name in self._event_dict:  # otherwise, cache
+                        self._event_dict[event_name].put(event_obj)
+                    else:
+                        q = queue.Queue()
+                        q.put(event_obj)
+                        self._event_dict[event_name] = q
+                    self._event_added.notify_all()
 
     def register_handler(self, handler, event_name, args):
         """Registers an event handler.
@@ -282,6 +285,8 @@ class EventDispatcher:
                 should match in order to be popped.
             timeout: Number of seconds to wait for events in case no event
                 matching the condition exits when the function is called.
+            freq: Deprecated; waiting is now event-driven rather than
+                periodic.
 
         Returns:
             results: Pop events whose names match a regex pattern.
@@ -296,12 +301,15 @@ class EventDispatcher:
             raise IllegalStateError(
                 "Dispatcher needs to be started before popping.")
         deadline = time.time() + timeout
-        while True:
-            # TODO: fix the sleep loop
-            results = self._match_and_pop(regex_pattern)
-            if len(results) != 0 or time.time() > deadline:
-                break
-            time.sleep(freq)
+        with self._event_added:
+            while True:
+                results = self._match_and_pop(regex_pattern)
+                remaining = deadline - time.time()
+                if len(results) != 0 or remaining <= 0:
+                    break
+                # Block until the polling thread queues a new event rather
+                # than sleeping for a fixed period and re-scanning.
+                self._event_added.wait(remaining)
         if len(results) == 0:
             raise queue.Empty('Timeout after {}s waiting for event: {}'.format(
                 timeout, regex_pattern))
@@ -17,6 +17,8 @@ import threading
 
 import time
 
+from concurrent.futures import ThreadPoolExecutor
+
 from acts import logger
 from acts.controllers.sl4a_lib import rpc_client
 from acts.controllers.sl4a_lib import sl4a_session
@@ -284,10 +286,29 @@ class Sl4aManager(object):
         self._started = False
 
     def terminate_all_sessions(self):
-        """Terminates all SL4A sessions gracefully."""
+        """Terminates all SL4A sessions gracefully.
+
+        Sessions are terminated concurrently, since each termination mostly
+        waits on device round trips. Every termination is attempted before
+        any failure is raised, so one bad session does not leave the others
+        running.
+        """
         self.error_reporter.finalize_reports()
-        for _, session in self.sessions.items():
-            session.terminate()
+        sessions = list(self.sessions.values())
+        if sessions:
+            with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+                futures = [
+                    executor.submit(session.terminate)
+                    for session in sessions
+                ]
+            errors = []
+            for future in futures:
+                if future.exception() is not None:
+                    errors.append(future.exception())
+            if errors:
+                for error in errors[1:]:
+                    self.log.error('Failed to terminate session: %s' % error)
+                raise errors[0]
         self.sessions = {}
         self._close_all_ports()
 
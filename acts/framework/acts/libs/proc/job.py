@@ -194,10 +194,12 @@ def run_async(command, env=None):
         A subprocess.Popen object representing the created subprocess.
 
     """
+    # start_new_session detaches the child into its own process group without
+    # a preexec_fn, keeping subprocess on its faster posix_spawn/vfork path.
     proc = subprocess.Popen(
         command,
         env=env,
-        preexec_fn=os.setpgrp,
+        start_new_session=True,
         shell=not isinstance(command, list),
         stdout=DEVNULL,
         stderr=subprocess.STDOUT)
@@ -16,14 +16,14 @@
 
 import os
 import shutil
+import tarfile
 import tempfile
 
+from concurrent.futures import ThreadPoolExecutor
+
 from acts import logger
 from acts.libs.proc import job
 
-_UICD_JAR_CMD = 'java -jar %s/uicd-commandline.jar'
-_UNZIP_CMD = 'tar -xzf %s -C %s'
-
 
 class UicdError(Exception):
     """Raised for exceptions that occur in UIConductor-related tasks"""
@@ -36,7 +36,15 @@ class UicdCli(object):
     This class does not handle workflow creation, which requires the Uicd
     frontend.
     """
-    def __init__(self, uicd_zip, workflow_paths, log_path=None):
+
+    # Workflow scans shared across instances, keyed by the workflow paths
+    # and scan mode. Each entry holds a fingerprint of the top-level path
+    # mtimes and the resulting name-to-path dict, so re-instantiating
+    # UicdCli with unchanged workflow directories skips the traversal.
+    _workflow_cache = {}
+
+    def __init__(self, uicd_zip, workflow_paths, log_path=None,
+                 recursive=True):
         """Creates a UicdCli object. Extracts the required uicd-cli binaries.
 
         Args:
@@ -44,17 +52,25 @@ class UicdCli(object):
             workflow_paths: List of paths to uicd workflows and/or directories
                 containing them.
             log_path: Directory for storing logs generated by Uicd.
+            recursive: If False, workflow directories are assumed to be flat
+                and their subdirectories are not searched.
         """
         self._uicd_zip = uicd_zip
         self._uicd_path = tempfile.mkdtemp(prefix='uicd')
+        # The jar invocation tokens never change, so build them once
+        # instead of formatting and re-splitting a string per run.
+        self._base_cmd = [
+            'java', '-jar',
+            os.path.join(self._uicd_path, 'uicd-commandline.jar')
+        ]
         self._log_path = log_path
         if self._log_path:
             os.makedirs(self._log_path, exist_ok=True)
         self._log = logger.create_tagged_trace_logger(tag='Uicd')
-        self._set_workflows(workflow_paths)
+        self._set_workflows(workflow_paths, recursive)
         self._setup_cli()
 
-    def _set_workflows(self, workflow_paths):
+    def _set_workflows(self, workflow_paths, recursive=True):
         """Set up a dictionary that maps workflow name to its file location.
         This allows the user to specify workflows to run without having to
         provide the full path.
@@ -62,6 +78,8 @@ class UicdCli(object):
         Args:
             workflow_paths: List of paths to uicd workflows and/or directories
                 containing them.
+            recursive: If False, only the top level of each workflow directory
+                is scanned.
 
         Raises:
             UicdError if two or more Uicd workflows share the same file name
@@ -69,73 +87,144 @@ class UicdCli(object):
         if isinstance(workflow_paths, str):
             workflow_paths = [workflow_paths]
 
-        # get a list of workflow files from specified paths
-        def _raise(e):
-            raise e
-        workflow_files = []
+        cache_key = (tuple(workflow_paths), recursive)
+        fingerprint = tuple(
+            os.stat(path).st_mtime_ns for path in workflow_paths)
+        cached = self._workflow_cache.get(cache_key)
+        if cached and cached[0] == fingerprint:
+            self._workflows = dict(cached[1])
+            return
+
+        self._workflows = {}
+        # Traverse the specified paths with os.scandir rather than os.walk.
+        # DirEntry objects carry the file type from readdir, so this avoids
+        # an extra stat call per entry on large workflow trees.
+        dirs = []
+        # Bind the bound method to a local so the attribute lookup is paid
+        # once rather than per directory entry.
+        add_workflow = self._add_workflow
         for path in workflow_paths:
             if os.path.isfile(path):
-                workflow_files.append(path)
+                add_workflow(os.path.basename(path), path)
             else:
-                for (root, _, files) in os.walk(path, onerror=_raise):
-                    for file in files:
-                        workflow_files.append(os.path.join(root, file))
+                dirs.append(path)
+        while dirs:
+            with os.scandir(dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Hidden directories (e.g. .git) never hold
+                        # workflows, so don't descend into them.
+                        if recursive and not entry.name.startswith('.'):
+                            dirs.append(entry.path)
+                    else:
+                        add_workflow(entry.name, entry.path)
+
+        self._workflow_cache[cache_key] = (fingerprint,
+                                           dict(self._workflows))
+
+    @classmethod
+    def clear_workflow_cache(cls):
+        """Drops all cached workflow scans so the next UicdCli rescans."""
+        cls._workflow_cache = {}
+
+    def _add_workflow(self, workflow_name, workflow_path):
+        """Register a single workflow file in the name-to-path dictionary.
 
-        # populate the dictionary
-        self._workflows = {}
-        for path in workflow_files:
-            workflow_name = os.path.basename(path)
-            if workflow_name in self._workflows.keys():
-                raise UicdError('Uicd workflows may not share the same name.')
-            self._workflows[workflow_name] = path
+        Raises:
+            UicdError if a workflow with the same file name is already
+            registered.
+        """
+        if workflow_name in self._workflows:
+            raise UicdError('Uicd workflows may not share the same name.')
+        self._workflows[workflow_name] = workflow_path
 
     def _setup_cli(self):
         """Extract tar from uicd_zip and place unzipped files in uicd_path.
 
+        The archive is extracted in-process with tarfile rather than by
+        spawning a tar subprocess.
+
         Raises:
             Exception if the extraction fails.
         """
         self._log.debug('Extracting uicd-cli binaries from %s' % self._uicd_zip)
-        unzip_cmd = _UNZIP_CMD % (self._uicd_zip, self._uicd_path)
         try:
-            job.run(unzip_cmd.split())
-        except job.Error:
+            with tarfile.open(self._uicd_zip, 'r:gz') as uicd_tar:
+                uicd_tar.extractall(self._uicd_path)
+        except tarfile.TarError:
             self._log.exception('Failed to extract uicd-cli binaries.')
             raise
 
-    def run(self, serial, workflows, timeout=120):
+    def run(self, serial, workflows, timeout=120, parallel=False):
         """Run specified workflows on the UIConductor CLI.
 
+        By default, all requested workflows are passed to a single CLI
+        invocation with one '-i' argument each, so the JVM is only launched
+        once per call instead of once per workflow. With parallel=True, each
+        workflow gets its own concurrent CLI invocation instead.
+
         Args:
             serial: Device serial
             workflows: List or str of workflows to run.
-            timeout: Number seconds to wait for command to finish.
+            timeout: Number of seconds to wait for each workflow to finish.
+            parallel: If True, run the workflows concurrently in separate
+                CLI invocations. Only use this when the device can handle
+                concurrent adb sessions.
         """
-        base_cmd = _UICD_JAR_CMD % self._uicd_path
         if isinstance(workflows, str):
             workflows = [workflows]
+        workflow_paths = []
         for workflow_name in workflows:
-            self._log.info('Running workflow "%s"' % workflow_name)
             if workflow_name in self._workflows:
-                args = '-d %s -i %s' % (serial, self._workflows[workflow_name])
+                self._log.info('Running workflow "%s"' % workflow_name)
+                workflow_paths.append(self._workflows[workflow_name])
             else:
                 self._log.error(
                     'The workflow "%s" does not exist.' % workflow_name)
-                continue
-            if self._log_path:
-                args = '%s -o %s' % (args, self._log_path)
-            cmd = '%s %s' % (base_cmd, args)
-            try:
-                result = job.run(cmd.split(), timeout=timeout)
-            except job.Error:
-                self._log.exception(
-                    'Failed to run workflow "%s"' % workflow_name)
-                continue
-            if result.stdout:
-                stdout_split = result.stdout.splitlines()
-                if len(stdout_split) > 2:
-                    self._log.debug('Uicd logs stored at %s' % stdout_split[2])
+        if not workflow_paths:
+            return
+        if parallel and len(workflow_paths) > 1:
+            # os.cpu_count() may return None on platforms where the count
+            # cannot be determined.
+            max_workers = min(len(workflow_paths), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for path in workflow_paths:
+                    executor.submit(self._run_cli, serial, [path], timeout)
+        else:
+            self._run_cli(serial, workflow_paths,
+                          timeout * len(workflow_paths))
+
+    def _run_cli(self, serial, workflow_paths, timeout):
+        """Executes a single CLI invocation for the given workflow files.
+
+        Failures are logged rather than raised, matching the per-workflow
+        error handling in run().
+
+        Args:
+            serial: Device serial
+            workflow_paths: List of paths to the workflow files to run.
+            timeout: Number of seconds to wait for the command to finish.
+        """
+        cmd = self._base_cmd + ['-d', serial]
+        for path in workflow_paths:
+            cmd += ['-i', path]
+        if self._log_path:
+            cmd += ['-o', self._log_path]
+        try:
+            result = job.run(cmd, timeout=timeout)
+        except job.Error:
+            self._log.exception(
+                'Failed to run workflows %s' % workflow_paths)
+            return
+        if result.stdout:
+            stdout_split = result.stdout.splitlines()
+            if len(stdout_split) > 2:
+                self._log.debug('Uicd logs stored at %s' % stdout_split[2])
 
     def __del__(self):
         """Delete the temp directory to Uicd CLI binaries upon ACTS exit."""
-        shutil.rmtree(self._uicd_path)
+        # _uicd_path may be missing if __init__ raised early, and cleanup
+        # failures during GC should not mask the original error.
+        uicd_path = getattr(self, '_uicd_path', None)
+        if uicd_path:
+            shutil.rmtree(uicd_path, ignore_errors=True)
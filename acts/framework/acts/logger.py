@@ -128,13 +128,13 @@ def logline_timestamp_comparator(t1, t2):
     Returns:
         -1 if t1 < t2; 1 if t1 > t2; 0 if t1 == t2.
     """
-    dt1 = _parse_logline_timestamp(t1)
-    dt2 = _parse_logline_timestamp(t2)
-    for u1, u2 in zip(dt1, dt2):
-        if u1 < u2:
-            return -1
-        elif u1 > u2:
-            return 1
+    # Logline timestamps are fixed-width and zero-padded with identical
+    # separators, so comparing them lexicographically is equivalent to
+    # splitting them into fields first and much cheaper.
+    if t1 < t2:
+        return -1
+    elif t1 > t2:
+        return 1
     return 0
 
 
@@ -92,9 +92,16 @@ class BaseSimulation():
         # Gets BTS1 since this sim only has 1 BTS
         self.bts1 = self.anritsu.get_BTS(BtsNumber.BTS1)
 
+        # The callbox version cannot change during a simulation, so look it
+        # up once instead of on every power change.
+        self._callbox_version = self.anritsu._md8475_version
+
         # Store the current calibrated band
         self.current_calibrated_band = None
 
+        # Whether IP (UDP) traffic is currently running on APN 1
+        self._ip_traffic_on = False
+
         # Path loss measured during calibration
         self.dl_path_loss = None
         self.ul_path_loss = None
@@ -110,6 +117,24 @@ class BaseSimulation():
         # Enable roaming on the phone
         toggle_cell_data_roaming(self.dut, True)
 
+    def _wait_for_apm_state(self, state, timeout=2):
+        """ Waits for the airplane mode setting to propagate to the phone.
+
+        Polls the phone's airplane mode state instead of sleeping for a
+        fixed settling time, so chained operations don't serialize on
+        worst-case delays.
+
+        Args:
+            state: the expected airplane mode state
+            timeout: maximum time in seconds to wait for the state
+        """
+
+        end_time = time.time() + timeout
+        while time.time() < end_time:
+            if self.dut.droid.connectivityCheckAirplaneMode() == state:
+                return
+            time.sleep(0.1)
+
     def start(self):
         """ Start simulation.
 
@@ -121,7 +146,7 @@ class BaseSimulation():
         toggle_airplane_mode(self.log, self.dut, True)
 
         # Wait for airplane mode setting to propagate
-        time.sleep(2)
+        self._wait_for_apm_state(True)
 
         # Start simulation if it wasn't started
         self.anritsu.start_simulation()
@@ -140,7 +165,7 @@ class BaseSimulation():
         toggle_airplane_mode(self.log, self.dut, True)
 
         # Wait for airplane mode setting to propagate
-        time.sleep(2)
+        self._wait_for_apm_state(True)
 
         # Provide a good signal power for the phone to attach easily
         self.bts1.input_level = -10
@@ -170,7 +195,7 @@ class BaseSimulation():
                 toggle_airplane_mode(self.log, self.dut, True)
 
                 # Wait for APM to propagate
-                time.sleep(3)
+                self._wait_for_apm_state(True, timeout=3)
 
                 # Retry
                 if i < self.ATTACH_MAX_RETRIES - 1:
@@ -207,7 +232,7 @@ class BaseSimulation():
         toggle_airplane_mode(self.log, self.dut, True)
 
         # Wait for APM to propagate
-        time.sleep(2)
+        self._wait_for_apm_state(True)
 
         # Power off basestation
         self.anritsu.set_simulation_state_to_poweroff()
@@ -224,7 +249,7 @@ class BaseSimulation():
         toggle_airplane_mode(self.log, self.dut, True)
 
         # Wait for APM to propagate
-        time.sleep(2)
+        self._wait_for_apm_state(True)
 
         # Stop the simulation
         self.anritsu.stop_simulation()
@@ -263,16 +288,18 @@ class BaseSimulation():
             # parameter_name is not set
             return []
 
-        return_list = []
+        # Extract the name and its values with a single slice instead of
+        # popping the elements one by one, which shifts the remainder of
+        # the list on every pop.
+        return_list = parameters[i:i + num_values + 1]
 
-        try:
-            for j in range(num_values + 1):
-                return_list.append(parameters.pop(i))
-        except IndexError:
+        if len(return_list) < num_values + 1:
             raise ValueError(
                 "Parameter {} has to be followed by {} values.".format(
                     parameter_name, num_values))
 
+        del parameters[i:i + num_values + 1]
+
         return return_list
 
     def set_downlink_rx_power(self, bts, signal_level):
@@ -293,15 +320,14 @@ class BaseSimulation():
         # Try to use measured path loss value. If this was not set, it will
         # throw an TypeError exception
         try:
+            max_dl_power = self.DL_MAX_POWER[self._callbox_version]
             calibrated_power = round(power + self.dl_path_loss)
-            if (calibrated_power >
-                    self.DL_MAX_POWER[self.anritsu._md8475_version]):
+            if calibrated_power > max_dl_power:
                 self.log.warning(
                     "Cannot achieve phone DL Rx power of {} dBm. Requested TX "
                     "power of {} dBm exceeds callbox limit!".format(
                         power, calibrated_power))
-                calibrated_power = self.DL_MAX_POWER[
-                    self.anritsu._md8475_version]
+                calibrated_power = max_dl_power
                 self.log.warning(
                     "Setting callbox Tx power to max possible ({} dBm)".format(
                         calibrated_power))
@@ -374,6 +400,7 @@ class BaseSimulation():
 
         if self.dl_path_loss and self.ul_path_loss:
             self.log.info("Measurements are already calibrated.")
+            return
 
         # Attach the phone to the base station
         if not self.attach():
@@ -381,16 +408,77 @@ class BaseSimulation():
                 "Skipping calibration because the phone failed to attach.")
             return
 
+        # Downlink and uplink calibration use the same IP traffic session,
+        # so start it once here instead of letting each measurement stop
+        # and restart it in between.
+        if not self.tbs_pattern_on:
+            self._start_ip_traffic()
+
         # If downlink or uplink were not yet calibrated, do it now
         if not self.dl_path_loss:
             self.dl_path_loss = self.downlink_calibration(self.bts1)
         if not self.ul_path_loss:
             self.ul_path_loss = self.uplink_calibration(self.bts1)
 
+        if not self.tbs_pattern_on:
+            self._stop_ip_traffic()
+
         # Detach after calibrating
         self.detach()
         time.sleep(2)
 
+    def _start_ip_traffic(self):
+        """ Starts IP (UDP) traffic on APN 1 if it is not already running.
+
+        Returns:
+            True if this call started the traffic, False if it was already
+            running.
+        """
+
+        if self._ip_traffic_on:
+            return False
+        try:
+            self.anritsu.send_command('OPERATEIPTRAFFIC START,1')
+        except AnritsuError as inst:
+            self.log.warning("{}\n".format(inst))  # Typically RUNNING already
+        time.sleep(4)
+        self._ip_traffic_on = True
+        return True
+
+    def _stop_ip_traffic(self):
+        """ Stops IP (UDP) traffic on APN 1 if it is running. """
+
+        if not self._ip_traffic_on:
+            return
+        try:
+            self.anritsu.send_command('OPERATEIPTRAFFIC STOP,1')
+        except AnritsuError as inst:
+            self.log.warning("{}\n".format(inst))  # Typically STOPPED already
+        time.sleep(2)
+        self._ip_traffic_on = False
+
+    def _wait_for_rsrp_update(self, rat, previous_value, timeout=4):
+        """ Waits for the phone to report an updated signal strength.
+
+        The reported value refreshes as soon as a new measurement report
+        arrives, so polling it returns much earlier than the conservative
+        fixed settling sleep on most attaches.
+
+        Args:
+            rat: RAT key to read from the reported signal strength
+            previous_value: reading from the previous iteration, or None
+            timeout: maximum time in seconds to wait for an update
+        Returns:
+            The latest reported signal strength for the given RAT.
+        """
+
+        end_time = time.time() + timeout
+        while True:
+            signal_strength = get_telephony_signal_strength(self.dut)[rat]
+            if signal_strength != previous_value or time.time() > end_time:
+                return signal_strength
+            time.sleep(0.2)
+
     def downlink_calibration(self,
                              bts,
                              rat=None,
@@ -420,50 +508,46 @@ class BaseSimulation():
                 "The parameter 'rat' has to indicate the RAT being used as "
                 "reported by the phone.")
 
+        # Hoist the chained attribute lookups used inside the measurement
+        # loop into locals.
+        droid = self.dut.droid
+        dl_target_power = self.DL_CAL_TARGET_POWER[self._callbox_version]
+
         # Set BTS to a good output level to minimize measurement error
         init_output_level = bts.output_level
-        initial_screen_timeout = self.dut.droid.getScreenTimeout()
-        bts.output_level = self.DL_CAL_TARGET_POWER[
-            self.anritsu._md8475_version]
+        initial_screen_timeout = droid.getScreenTimeout()
+        bts.output_level = dl_target_power
 
         # Set phone sleep time out
-        self.dut.droid.setScreenTimeout(1800)
-        self.dut.droid.goToSleepNow()
+        droid.setScreenTimeout(1800)
+        droid.goToSleepNow()
         time.sleep(2)
 
         # Starting first the IP traffic (UDP): Using always APN 1
-        if not self.tbs_pattern_on:
-            try:
-                cmd = 'OPERATEIPTRAFFIC START,1'
-                self.anritsu.send_command(cmd)
-            except AnritsuError as inst:
-                self.log.warning(
-                    "{}\n".format(inst))  # Typically RUNNING already
-            time.sleep(4)
-
-        down_power_measured = []
+        traffic_started = (not self.tbs_pattern_on
+                           and self._start_ip_traffic())
+
+        down_power_measured = np.empty(self.NUM_DL_CAL_READS)
+        # Seed the update detection with the stale pre-wake reading so the
+        # first sample also waits for the refresh triggered by screen ON,
+        # rather than returning immediately with the pre-wake value.
+        previous_reading = get_telephony_signal_strength(self.dut)[rat]
         for i in range(0, self.NUM_DL_CAL_READS):
             # For some reason, the RSRP gets updated on Screen ON event
-            self.dut.droid.wakeUpNow()
-            time.sleep(4)
-            signal_strength = get_telephony_signal_strength(self.dut)
-            down_power_measured.append(signal_strength[rat])
-            self.dut.droid.goToSleepNow()
+            droid.wakeUpNow()
+            previous_reading = self._wait_for_rsrp_update(
+                rat, previous_reading)
+            down_power_measured[i] = previous_reading
+            droid.goToSleepNow()
             time.sleep(5)
 
-        # Stop the IP traffic (UDP)
-        if not self.tbs_pattern_on:
-            try:
-                cmd = 'OPERATEIPTRAFFIC STOP,1'
-                self.anritsu.send_command(cmd)
-            except AnritsuError as inst:
-                self.log.warning(
-                    "{}\n".format(inst))  # Typically STOPPED already
-            time.sleep(2)
+        # Stop the IP traffic (UDP) if this measurement started it
+        if traffic_started:
+            self._stop_ip_traffic()
 
         # Reset phone and bts to original settings
-        self.dut.droid.goToSleepNow()
-        self.dut.droid.setScreenTimeout(initial_screen_timeout)
+        droid.goToSleepNow()
+        droid.setScreenTimeout(initial_screen_timeout)
         bts.output_level = init_output_level
         time.sleep(2)
 
@@ -478,8 +562,6 @@ class BaseSimulation():
             avg_down_power = reported_asu_power
 
         # Calculate Path Loss
-        dl_target_power = self.DL_CAL_TARGET_POWER[
-            self.anritsu._md8475_version]
         down_call_path_loss = dl_target_power - avg_down_power
 
         # Validate the result
@@ -507,63 +589,56 @@ class BaseSimulation():
             Uplink calibration value and measured UL power
         """
 
+        # Hoist the chained attribute lookups used inside the measurement
+        # loop into locals.
+        droid = self.dut.droid
+        send_query = self.anritsu.send_query
+
         # Set BTS1 to maximum input allowed in order to perform
         # uplink calibration
         target_power = self.MAX_PHONE_OUTPUT_POWER
         initial_input_level = bts.input_level
-        initial_screen_timeout = self.dut.droid.getScreenTimeout()
+        initial_screen_timeout = droid.getScreenTimeout()
         bts.input_level = self.MAX_BTS_INPUT_POWER
 
         # Set phone sleep time out
-        self.dut.droid.setScreenTimeout(1800)
-        self.dut.droid.wakeUpNow()
+        droid.setScreenTimeout(1800)
+        droid.wakeUpNow()
         time.sleep(2)
 
         # Starting first the IP traffic (UDP): Using always APN 1
-        if not self.tbs_pattern_on:
-            try:
-                cmd = 'OPERATEIPTRAFFIC START,1'
-                self.anritsu.send_command(cmd)
-            except AnritsuError as inst:
-                self.log.warning(
-                    "{}\n".format(inst))  # Typically RUNNING already
-            time.sleep(4)
+        traffic_started = (not self.tbs_pattern_on
+                           and self._start_ip_traffic())
 
-        up_power_per_chain = []
         # Get the number of chains
         cmd = 'MONITOR? UL_PUSCH'
-        uplink_meas_power = self.anritsu.send_query(cmd)
-        str_power_chain = uplink_meas_power.split(',')
-        num_chains = len(str_power_chain)
-        for ichain in range(0, num_chains):
-            up_power_per_chain.append([])
-
+        uplink_meas_power = send_query(cmd)
+        num_chains = len(uplink_meas_power.split(','))
+
+        # Parse each reading into a preallocated array instead of looping
+        # over the chains in Python. Chains reported as DEACTIVE keep their
+        # initial nan value.
+        up_power_per_chain = np.full((num_chains, self.NUM_UL_CAL_READS),
+                                     np.nan)
         for i in range(0, self.NUM_UL_CAL_READS):
-            uplink_meas_power = self.anritsu.send_query(cmd)
+            uplink_meas_power = send_query(cmd)
             str_power_chain = uplink_meas_power.split(',')
-
-            for ichain in range(0, num_chains):
-                if (str_power_chain[ichain] == 'DEACTIVE'):
-                    up_power_per_chain[ichain].append(float('nan'))
-                else:
-                    up_power_per_chain[ichain].append(
-                        float(str_power_chain[ichain]))
+            active = np.array(
+                [reading != 'DEACTIVE' for reading in str_power_chain])
+            up_power_per_chain[active, i] = np.fromiter(
+                (float(reading) for reading in str_power_chain
+                 if reading != 'DEACTIVE'),
+                dtype=np.float64)
 
             time.sleep(3)
 
-        # Stop the IP traffic (UDP)
-        if not self.tbs_pattern_on:
-            try:
-                cmd = 'OPERATEIPTRAFFIC STOP,1'
-                self.anritsu.send_command(cmd)
-            except AnritsuError as inst:
-                self.log.warning(
-                    "{}\n".format(inst))  # Typically STOPPED already
-            time.sleep(2)
+        # Stop the IP traffic (UDP) if this measurement started it
+        if traffic_started:
+            self._stop_ip_traffic()
 
         # Reset phone and bts to original settings
-        self.dut.droid.goToSleepNow()
-        self.dut.droid.setScreenTimeout(initial_screen_timeout)
+        droid.goToSleepNow()
+        droid.setScreenTimeout(initial_screen_timeout)
         bts.input_level = initial_input_level
         time.sleep(2)
 
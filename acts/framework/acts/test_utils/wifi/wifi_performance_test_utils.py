@@ -609,6 +609,31 @@ def get_scan_rssi_nb(dut, tracked_bssids, num_measurements=1):
 
 
 ## Attenuator Utilities
+def set_atten_all(atten_list, atten_level, strict=True):
+    """Set all attenuators to the same level concurrently.
+
+    Each attenuator is independent hardware, so the blocking set_atten
+    calls are fanned out over a thread pool instead of being issued one
+    after the other.
+
+    Args:
+        atten_list: list of attenuators to set
+        atten_level: attenuation desired on all paths
+        strict: passed through to set_atten
+    """
+    if not atten_list:
+        return
+    with ThreadPoolExecutor(max_workers=len(atten_list)) as executor:
+        futures = [
+            executor.submit(atten.set_atten, atten_level, strict=strict)
+            for atten in atten_list
+        ]
+        # Collect the results so a failed set_atten raises here, as it
+        # did when the attenuators were set serially.
+        for future in futures:
+            future.result()
+
+
 def atten_by_label(atten_list, path_label, atten_level):
     """Attenuate signals according to their path label.
 
@@ -14,10 +14,15 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+import contextlib
 import fcntl
 import selenium
 import splinter
 import time
+from concurrent.futures import ThreadPoolExecutor
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.ui import WebDriverWait
 from acts import logger
 from acts.controllers import access_point
 from acts.controllers.ap_lib import bridge_interface
@@ -46,19 +51,53 @@ def create(configs):
         ("Netgear", "R8500"): "NetgearR8500AP",
         ("Google", "Wifi"): "GoogleWifiAP"
     }
-    objs = []
+    ap_classes = []
     for config in configs:
         try:
             ap_class_name = SUPPORTED_APS[(config["brand"], config["model"])]
-            ap_class = globals()[ap_class_name]
+            ap_classes.append(globals()[ap_class_name])
         except KeyError:
             raise KeyError("Invalid retail AP brand and model combination.")
-        objs.append(ap_class(config))
-    return objs
+    if len(configs) == 1:
+        return [ap_classes[0](configs[0])]
+    # AP objects are independent, and instantiation is dominated by waiting
+    # on the WebDriver protocol and AP reboots, so bring the APs up in
+    # parallel. executor.map preserves the ordering of configs.
+    with ThreadPoolExecutor(max_workers=min(len(configs), 8)) as executor:
+        return list(
+            executor.map(lambda args: args[0](args[1]),
+                         zip(ap_classes, configs)))
+
+
+def destroy(objs):
+    # Browser sessions are opened per call and released with the lock file,
+    # so there is nothing to tear down per AP object.
+    return
 
 
-def detroy(objs):
-    return
+# Deprecated misspelling kept for existing callers.
+detroy = destroy
+
+
+def _setting_key_map(config_page_fields):
+    """Maps config page field keys to their ap_settings key names.
+
+    Computed once per AP class alongside config_page_fields, so the hot
+    read/configure loops can look up e.g. ("2G", "ssid") -> "ssid_2G"
+    instead of re-formatting the key name on every iteration.
+
+    Args:
+        config_page_fields: dict keyed by "region" or (network, attribute)
+            tuples, mapping to form field names.
+
+    Returns:
+        dict mapping each config_page_fields key to its ap_settings key.
+    """
+    return {
+        key: ("{}_{}".format(key[1], key[0]) if isinstance(key, tuple) else
+              key)
+        for key in config_page_fields
+    }
 
 
 class BlockingBrowser(splinter.driver.webdriver.chrome.WebDriver):
@@ -100,9 +139,12 @@ class BlockingBrowser(splinter.driver.webdriver.chrome.WebDriver):
         while time.time() < start_time + self.timeout:
             try:
                 fcntl.flock(self.lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                # keep_alive reuses one HTTP connection to chromedriver
+                # rather than opening a new one per WebDriver command.
                 self.driver = selenium.webdriver.Chrome(
                     options=self.chrome_options,
-                    desired_capabilities=self.chrome_capabilities)
+                    desired_capabilities=self.chrome_capabilities,
+                    keep_alive=True)
                 self.element_class = splinter.driver.webdriver.WebDriverElement
                 self._cookie_manager = splinter.driver.webdriver.cookie_manager.CookieManager(
                     self.driver)
@@ -128,6 +170,39 @@ class BlockingBrowser(splinter.driver.webdriver.chrome.WebDriver):
         self.quit()
         self.__enter__()
 
+    def accept_alert_if_present(self, wait_time=BROWSER_WAIT_SHORT):
+        """Method to accept alert if pop up on page.
+
+        Waits for an alert to appear rather than sleeping for a fixed time
+        and checking, so the common no-alert case returns quickly.
+
+        Args:
+            wait_time: maximum time to wait for the alert
+        """
+        try:
+            WebDriverWait(self.driver, wait_time).until(
+                expected_conditions.alert_is_present())
+            alert = self.get_alert()
+            alert.accept()
+        except:
+            pass
+
+    def wait_for_frame(self, frame_name, wait_time=BROWSER_WAIT_LONG):
+        """Method to wait until the named iframe is attached and loaded.
+
+        Waiting on frame availability returns as soon as the page has
+        built its frames after a navigation click, instead of sleeping
+        for a fixed time that must cover the worst case.
+
+        Args:
+            frame_name: name attribute of the iframe to wait for
+            wait_time: maximum time to wait for the frame
+        """
+        WebDriverWait(self.driver, wait_time).until(
+            expected_conditions.frame_to_be_available_and_switch_to_it(
+                (By.NAME, frame_name)))
+        self.driver.switch_to.default_content()
+
     def visit_persistent(self,
                          url,
                          page_load_timeout,
@@ -157,9 +232,11 @@ class BlockingBrowser(splinter.driver.webdriver.chrome.WebDriver):
 
             page_reached = self.url.split("/")[-1] == url.split("/")[-1]
             if check_for_element:
-                time.sleep(BROWSER_WAIT_MED)
-                element = self.find_by_id(check_for_element)
-                if not element:
+                try:
+                    WebDriverWait(self.driver, BROWSER_WAIT_MED).until(
+                        expected_conditions.presence_of_element_located(
+                            (By.ID, check_for_element)))
+                except:
                     page_reached = 0
             if page_reached:
                 break
@@ -183,17 +260,129 @@ class WifiRetailAP(object):
     exceptions.
     """
 
+    # Batch-update state. While _batch_mode is set, update_ap_settings only
+    # records new values and the configure_ap call is deferred until
+    # commit_batch. _dirty_settings holds the names of settings changed
+    # since the last configure_ap so subclasses can skip untouched fields.
+    _batch_mode = False
+    _dirty_settings = frozenset()
+    _batch_status_toggled = False
+
+    # Scraped settings are considered fresh for this many seconds. Within
+    # the window, read_ap_settings returns the cached ap_settings instead
+    # of launching a browser and scraping the config page again.
+    _settings_cache_ttl = 30
+    _settings_cache_ts = 0
+
+    # Snapshots a list of form fields in a single WebDriver round trip.
+    # Takes a list of element names and returns, for each name, the value
+    # and checked state of every matching element, so the per-field
+    # findElement commands can be replaced by one execute_script call.
+    _field_snapshot_js = (
+        "var out = {};"
+        "arguments[0].forEach(function(name) {"
+        "out[name] = [].map.call(document.getElementsByName(name), "
+        "function(el) { return {value: el.value, checked: el.checked}; });"
+        "});"
+        "return out;")
+
+    # Writes a batch of form fields in a single WebDriver round trip.
+    # Takes a list of [name, mode, value] triples and returns the names
+    # that could not be written, e.g. because the requested option does
+    # not exist on this AP. See _write_fields for the supported modes.
+    _field_write_js = (
+        "var missed = [];"
+        "arguments[0].forEach(function(field) {"
+        "var name = field[0], mode = field[1], value = field[2];"
+        "var els = document.getElementsByName(name);"
+        "var el = null;"
+        "if (mode == 'select_text' || mode == 'select_value') {"
+        "var sel = els[0];"
+        "if (sel && sel.options) {"
+        "for (var i = 0; i < sel.options.length; i++) {"
+        "var opt = sel.options[i];"
+        "if ((mode == 'select_text' ? opt.text : opt.value) == value) {"
+        "sel.selectedIndex = i; el = sel; break; } } }"
+        "} else if (mode == 'check') {"
+        "for (var i = 0; i < els.length; i++) {"
+        "if (els[i].value == value) {"
+        "els[i].checked = true; el = els[i]; break; } }"
+        "} else if (els[0]) {"
+        "els[0].value = value; el = els[0]; }"
+        "if (el) { el.dispatchEvent(new Event('change', {bubbles: true})); }"
+        "else { missed.push(name); }"
+        "});"
+        "return missed;")
+
     def __init__(self, ap_settings):
         raise NotImplementedError
 
-    def read_ap_settings(self):
+    @contextlib.contextmanager
+    def _open_browser(self, browser=None):
+        """Context manager yielding an open browser session.
+
+        Reusing an existing session avoids a full Chrome cold start per
+        method call when several AP operations run back to back.
+
+        Args:
+            browser: an already-open BlockingBrowser session to reuse. If
+                None, a new session is opened and closed around the block.
+        """
+        if browser:
+            yield browser
+        else:
+            with BlockingBrowser(self.ap_settings["headless_browser"],
+                                 900) as browser:
+                yield browser
+
+    def read_ap_settings(self, force=False):
         """Function that reads current ap settings.
 
         Function implementation is AP dependent and thus base class raises exception
         if function not implemented in child class.
+
+        Args:
+            force: if True, re-read even if the cached settings are fresh
         """
         raise NotImplementedError
 
+    def _settings_cache_is_fresh(self, force=False):
+        """Function that checks if a settings read can use the cache.
+
+        Args:
+            force: if True, the cache is always considered stale
+
+        Returns:
+            True if the last scrape is within _settings_cache_ttl seconds.
+        """
+        if force:
+            return False
+        return time.time() - self._settings_cache_ts < self._settings_cache_ttl
+
+    def _invalidate_settings_cache(self):
+        """Function that forces the next read_ap_settings to scrape."""
+        self._settings_cache_ts = 0
+
+    def _write_fields(self, browser, fields):
+        """Function that writes a batch of form fields in one round trip.
+
+        Args:
+            browser: browser session holding the target page
+            fields: list of (name, mode, value) tuples, where mode is
+                "select_text" (select option by visible text),
+                "select_value" (select option by value attribute),
+                "check" (check the radio/checkbox with the given value) or
+                "fill" (set an input's value)
+
+        Returns:
+            list of field names that could not be written, e.g. because
+            the requested option does not exist on this AP.
+        """
+        if not fields:
+            return []
+        return browser.driver.execute_script(
+            self._field_write_js, [list(field) for field in fields])
+
     def validate_ap_settings(self):
         """Function to validate ap settings.
 
@@ -207,7 +396,7 @@ class WifiRetailAP(object):
             ValueError: If read AP settings do not match stored settings.
         """
         assumed_ap_settings = self.ap_settings.copy()
-        actual_ap_settings = self.read_ap_settings()
+        actual_ap_settings = self.read_ap_settings(force=True)
         if assumed_ap_settings != actual_ap_settings:
             self.log.warning(
                 "Discrepancy in AP settings. Some settings may have been overwritten."
@@ -315,6 +504,48 @@ class WifiRetailAP(object):
         """
         raise NotImplementedError
 
+    def begin_batch(self):
+        """Function that starts a batch of setting updates.
+
+        While a batch is open, set_* calls and update_ap_settings only
+        record the new values; the configure_ap call is deferred until
+        commit_batch. This collapses N browser/apply/reboot cycles into
+        one when several settings are changed back to back.
+        """
+        self._batch_mode = True
+        self._dirty_settings = set()
+        self._batch_status_toggled = False
+
+    def commit_batch(self):
+        """Function that applies all settings changed since begin_batch.
+
+        All updates accumulated since begin_batch are pushed to the AP in
+        a single configure_ap call. Does nothing if no setting changed.
+        """
+        self._batch_mode = False
+        if self._dirty_settings:
+            try:
+                self.configure_ap(status_toggled=self._batch_status_toggled)
+            finally:
+                self._dirty_settings = frozenset()
+        self._batch_status_toggled = False
+
+    def _setting_is_dirty(self, field_key):
+        """Function that checks if a config page field needs rewriting.
+
+        Args:
+            field_key: key into config_page_fields, either "region" or a
+                (network, attribute) tuple.
+
+        Returns:
+            True if the setting behind the field changed since the last
+            configure_ap, or if no change tracking is active (in which
+            case all fields are written).
+        """
+        if not self._dirty_settings:
+            return True
+        return self._setting_keys[field_key] in self._dirty_settings
+
     def update_ap_settings(self, dict_settings={}, **named_settings):
         """Function to update settings of existing AP.
 
@@ -340,15 +571,27 @@ class WifiRetailAP(object):
 
         updates_requested = False
         status_toggle_flag = False
+        changed_settings = set()
         for setting, value in settings_to_update.items():
             if self.ap_settings[setting] != value:
                 self.ap_settings[setting] = value
+                changed_settings.add(setting)
                 if "status" in setting:
                     status_toggle_flag = True
                 updates_requested = True
 
+        if self._batch_mode:
+            self._dirty_settings.update(changed_settings)
+            self._batch_status_toggled = (self._batch_status_toggled
+                                          or status_toggle_flag)
+            return
+
         if updates_requested:
-            self.configure_ap(status_toggled=status_toggle_flag)
+            self._dirty_settings = changed_settings
+            try:
+                self.configure_ap(status_toggled=status_toggle_flag)
+            finally:
+                self._dirty_settings = frozenset()
 
     def band_lookup_by_channel(self, channel):
         """Function that gives band name by channel number.
@@ -367,6 +610,27 @@ class WifiRetailAP(object):
 class NetgearR7000AP(WifiRetailAP):
     """Class that implements Netgear R7500 AP."""
 
+    # The form field layout is fixed per AP model, so the mapping and its
+    # derived setting keys are shared by all instances of the class.
+    config_page_fields = {
+        "region": "WRegion",
+        ("2G", "status"): "enable_ap",
+        ("5G_1", "status"): "enable_ap_an",
+        ("2G", "ssid"): "ssid",
+        ("5G_1", "ssid"): "ssid_an",
+        ("2G", "channel"): "w_channel",
+        ("5G_1", "channel"): "w_channel_an",
+        ("2G", "bandwidth"): "opmode",
+        ("5G_1", "bandwidth"): "opmode_an",
+        ("2G", "power"): "enable_tpc",
+        ("5G_1", "power"): "enable_tpc_an",
+        ("2G", "security_type"): "security_type",
+        ("5G_1", "security_type"): "security_type_an",
+        ("2G", "password"): "passphrase",
+        ("5G_1", "password"): "passphrase_an"
+    }
+    _setting_keys = _setting_key_map(config_page_fields)
+
     def __init__(self, ap_settings):
         self.ap_settings = ap_settings.copy()
         self.log = logger.create_tagged_trace_logger("AccessPoint|{}".format(
@@ -374,8 +638,13 @@ class NetgearR7000AP(WifiRetailAP):
         self.init_gui_data()
         # Read and update AP settings
         self.read_ap_settings()
-        if not set(ap_settings.items()).issubset(self.ap_settings.items()):
-            self.update_ap_settings(ap_settings)
+        updated_settings = {
+            key: value
+            for key, value in ap_settings.items()
+            if self.ap_settings.get(key) != value
+        }
+        if updated_settings:
+            self.update_ap_settings(updated_settings)
 
     def init_gui_data(self):
         """Function to initialize data used while interacting with web GUI"""
@@ -433,23 +702,6 @@ class NetgearR7000AP(WifiRetailAP):
             "23": "Singapore",
             "24": "Taiwan"
         }
-        self.config_page_fields = {
-            "region": "WRegion",
-            ("2G", "status"): "enable_ap",
-            ("5G_1", "status"): "enable_ap_an",
-            ("2G", "ssid"): "ssid",
-            ("5G_1", "ssid"): "ssid_an",
-            ("2G", "channel"): "w_channel",
-            ("5G_1", "channel"): "w_channel_an",
-            ("2G", "bandwidth"): "opmode",
-            ("5G_1", "bandwidth"): "opmode_an",
-            ("2G", "power"): "enable_tpc",
-            ("5G_1", "power"): "enable_tpc_an",
-            ("2G", "security_type"): "security_type",
-            ("5G_1", "security_type"): "security_type_an",
-            ("2G", "password"): "passphrase",
-            ("5G_1", "password"): "passphrase_an"
-        }
         self.bw_mode_values = {
             "g and b": "11g",
             "145Mbps": "VHT20",
@@ -469,143 +721,162 @@ class NetgearR7000AP(WifiRetailAP):
             "VHT80": "Up to 1300 Mbps"
         }
 
-    def read_ap_settings(self):
-        """Function to read ap settings."""
-        with BlockingBrowser(self.ap_settings["headless_browser"],
-                             900) as browser:
-            # Visit URL
+    def read_ap_settings(self, force=False, browser=None):
+        """Function to read ap settings.
+
+        Args:
+            force: if True, re-read even if the cached settings are fresh
+            browser: open browser session to reuse, if any
+        """
+        if self._settings_cache_is_fresh(force):
+            return self.ap_settings.copy()
+        with self._open_browser(browser) as browser:
+            # Visit URL and snapshot all wireless fields in one round trip
             browser.visit_persistent(self.config_page, BROWSER_WAIT_MED, 10)
+            field_values = browser.driver.execute_script(
+                self._field_snapshot_js, [
+                    value for key, value in self.config_page_fields.items()
+                    if "status" not in key
+                ])
 
             for key, value in self.config_page_fields.items():
                 if "status" in key:
-                    browser.visit_persistent(self.config_page_advanced,
-                                             BROWSER_WAIT_MED, 10)
-                    config_item = browser.find_by_name(value)
-                    self.ap_settings["{}_{}".format(key[1], key[0])] = int(
-                        config_item.first.checked)
-                    browser.visit_persistent(self.config_page,
-                                             BROWSER_WAIT_MED, 10)
+                    continue
+                config_item = field_values[value]
+                if "bandwidth" in key:
+                    self.ap_settings[self._setting_keys[
+                        key]] = self.bw_mode_values[config_item[0]["value"]]
+                elif "power" in key:
+                    self.ap_settings[self._setting_keys[
+                        key]] = self.power_mode_values[config_item[0]["value"]]
+                elif "region" in key:
+                    self.ap_settings["region"] = self.region_map[
+                        config_item[0]["value"]]
+                elif "security_type" in key:
+                    for item in config_item:
+                        if item["checked"]:
+                            self.ap_settings[
+                                self._setting_keys[key]] = item["value"]
                 else:
-                    config_item = browser.find_by_name(value)
-                    if "bandwidth" in key:
-                        self.ap_settings["{}_{}".format(
-                            key[1], key[0])] = self.bw_mode_values[
-                                config_item.first.value]
-                    elif "power" in key:
-                        self.ap_settings["{}_{}".format(
-                            key[1], key[0])] = self.power_mode_values[
-                                config_item.first.value]
-                    elif "region" in key:
-                        self.ap_settings["region"] = self.region_map[
-                            config_item.first.value]
-                    elif "security_type" in key:
-                        for item in config_item:
-                            if item.checked:
-                                self.ap_settings["{}_{}".format(
-                                    key[1], key[0])] = item.value
-                    else:
-                        config_item = browser.find_by_name(value)
-                        self.ap_settings["{}_{}".format(
-                            key[1], key[0])] = config_item.first.value
+                    self.ap_settings[self._setting_keys[
+                        key]] = config_item[0]["value"]
+
+            # Radio status checkboxes live on the advanced page
+            browser.visit_persistent(self.config_page_advanced,
+                                     BROWSER_WAIT_MED, 10)
+            status_values = browser.driver.execute_script(
+                self._field_snapshot_js, [
+                    value for key, value in self.config_page_fields.items()
+                    if "status" in key
+                ])
+            for key, value in self.config_page_fields.items():
+                if "status" in key:
+                    self.ap_settings[self._setting_keys[key]] = int(
+                        status_values[value][0]["checked"])
+        self._settings_cache_ts = time.time()
         return self.ap_settings.copy()
 
-    def configure_ap(self, **config_flags):
-        """Function to configure ap wireless settings."""
-        # Turn radios on or off
-        if config_flags["status_toggled"]:
-            self.configure_radio_on_off()
-        # Configure radios
-        with BlockingBrowser(self.ap_settings["headless_browser"],
-                             900) as browser:
-            # Visit URL
-            browser.visit_persistent(self.config_page, BROWSER_WAIT_MED, 10)
+    def configure_ap(self, browser=None, **config_flags):
+        """Function to configure ap wireless settings.
+
+        Args:
+            browser: open browser session to reuse, if any
+            config_flags: optional configuration flags
+        """
+        self._invalidate_settings_cache()
+        with self._open_browser(browser) as browser:
+            # Turn radios on or off
+            if config_flags["status_toggled"]:
+                self.configure_radio_on_off(browser=browser)
+            # Visit URL. The no-login URL is tried directly; if the session
+            # is not yet authenticated, visit_persistent falls back to the
+            # credentialed URL and retries, so the unconditional priming
+            # visit is not needed.
             browser.visit_persistent(self.config_page_nologin,
                                      BROWSER_WAIT_MED, 10, self.config_page)
 
-            # Update region, and power/bandwidth for each network
-            config_item = browser.find_by_name(
-                self.config_page_fields["region"]).first
-            config_item.select_by_text(self.ap_settings["region"])
+            # Update region, and power/bandwidth for each network. Fields
+            # whose setting did not change since the last configure are
+            # left alone as they already hold the right value on the page,
+            # and each pass is written in a single WebDriver round trip.
+            fields = []
+            if self._setting_is_dirty("region"):
+                fields.append((self.config_page_fields["region"],
+                               "select_text", self.ap_settings["region"]))
             for key, value in self.config_page_fields.items():
-                if "power" in key:
-                    config_item = browser.find_by_name(value).first
-                    config_item.select_by_text(self.ap_settings["{}_{}".format(
-                        key[1], key[0])])
-                elif "bandwidth" in key:
-                    config_item = browser.find_by_name(value).first
-                    try:
-                        config_item.select_by_text(
-                            self.bw_mode_text[self.ap_settings["{}_{}".format(
-                                key[1], key[0])]])
-                    except AttributeError:
-                        self.log.warning(
-                            "Cannot select bandwidth. Keeping AP default.")
+                if "power" in key and self._setting_is_dirty(key):
+                    fields.append((value, "select_text",
+                                   self.ap_settings[self._setting_keys[key]]))
+                elif "bandwidth" in key and self._setting_is_dirty(key):
+                    fields.append((value, "select_text",
+                                   self.bw_mode_text[self.ap_settings[
+                                       self._setting_keys[key]]]))
+            missed = self._write_fields(browser, fields)
+            if missed:
+                self.log.warning(
+                    "Cannot set fields {}. Keeping AP default.".format(missed))
 
             # Update security settings (passwords updated only if applicable)
+            fields = []
             for key, value in self.config_page_fields.items():
-                if "security_type" in key:
-                    browser.choose(
-                        value, self.ap_settings["{}_{}".format(key[1],
-                                                               key[0])])
-                    if self.ap_settings["{}_{}".format(key[1],
-                                                       key[0])] == "WPA2-PSK":
-                        config_item = browser.find_by_name(
-                            self.config_page_fields[(key[0],
-                                                     "password")]).first
-                        config_item.fill(self.ap_settings["{}_{}".format(
-                            "password", key[0])])
+                if "security_type" in key and (self._setting_is_dirty(key) or
+                                               self._setting_is_dirty(
+                                                   (key[0], "password"))):
+                    security_type = self.ap_settings[self._setting_keys[key]]
+                    fields.append((value, "check", security_type))
+                    if security_type == "WPA2-PSK":
+                        fields.append(
+                            (self.config_page_fields[(key[0], "password")],
+                             "fill", self.ap_settings[self._setting_keys[(
+                                 key[0], "password")]]))
+            self._write_fields(browser, fields)
 
             # Update SSID and channel for each network
             # NOTE: Update ordering done as such as workaround for R8000
             # wherein channel and SSID get overwritten when some other
             # variables are changed. However, region does have to be set before
             # channel in all cases.
+            fields = []
             for key, value in self.config_page_fields.items():
+                if not isinstance(key, tuple) or not self._setting_is_dirty(
+                        key):
+                    continue
                 if "ssid" in key:
-                    config_item = browser.find_by_name(value).first
-                    config_item.fill(self.ap_settings["{}_{}".format(
-                        key[1], key[0])])
+                    fields.append((value, "fill",
+                                   self.ap_settings[self._setting_keys[key]]))
                 elif "channel" in key:
-                    config_item = browser.find_by_name(value).first
-                    try:
-                        config_item.select(self.ap_settings["{}_{}".format(
-                            key[1], key[0])])
-                        time.sleep(BROWSER_WAIT_SHORT)
-                    except AttributeError:
-                        self.log.warning(
-                            "Cannot select channel. Keeping AP default.")
-                    try:
-                        alert = browser.get_alert()
-                        alert.accept()
-                    except:
-                        pass
+                    fields.append((value, "select_value",
+                                   self.ap_settings[self._setting_keys[key]]))
+            missed = self._write_fields(browser, fields)
+            if missed:
+                self.log.warning(
+                    "Cannot set fields {}. Keeping AP default.".format(missed))
+            browser.accept_alert_if_present(BROWSER_WAIT_SHORT)
 
-            time.sleep(BROWSER_WAIT_SHORT)
+            WebDriverWait(browser.driver, BROWSER_WAIT_LONG).until(
+                expected_conditions.element_to_be_clickable(
+                    (By.NAME, "Apply")))
             browser.find_by_name("Apply").first.click()
-            time.sleep(BROWSER_WAIT_SHORT)
-            try:
-                alert = browser.get_alert()
-                alert.accept()
-                time.sleep(BROWSER_WAIT_SHORT)
-            except:
-                time.sleep(BROWSER_WAIT_SHORT)
+            browser.accept_alert_if_present(BROWSER_WAIT_SHORT)
             browser.visit_persistent(self.config_page, BROWSER_WAIT_EXTRA_LONG,
                                      10)
 
-    def configure_radio_on_off(self):
-        """Helper configuration function to turn radios on/off."""
-        with BlockingBrowser(self.ap_settings["headless_browser"],
-                             900) as browser:
-            # Visit URL
-            browser.visit_persistent(self.config_page, BROWSER_WAIT_MED, 10)
+    def configure_radio_on_off(self, browser=None):
+        """Helper configuration function to turn radios on/off.
+
+        Args:
+            browser: open browser session to reuse, if any
+        """
+        with self._open_browser(browser) as browser:
+            # Visit URL, using the landing page as backup to re-login
             browser.visit_persistent(self.config_page_advanced,
-                                     BROWSER_WAIT_MED, 10)
+                                     BROWSER_WAIT_MED, 10, self.config_page)
 
             # Turn radios on or off
             for key, value in self.config_page_fields.items():
                 if "status" in key:
                     config_item = browser.find_by_name(value).first
-                    if self.ap_settings["{}_{}".format(key[1], key[0])]:
+                    if self.ap_settings[self._setting_keys[key]]:
                         config_item.check()
                     else:
                         config_item.uncheck()
@@ -629,6 +900,25 @@ class NetgearR7000NAAP(NetgearR7000AP):
 class NetgearR7500AP(WifiRetailAP):
     """Class that implements Netgear R7500 AP."""
 
+    # The form field layout is fixed per AP model, so the mapping and its
+    # derived setting keys are shared by all instances of the class.
+    config_page_fields = {
+        "region": "WRegion",
+        ("2G", "status"): "enable_ap",
+        ("5G_1", "status"): "enable_ap_an",
+        ("2G", "ssid"): "ssid",
+        ("5G_1", "ssid"): "ssid_an",
+        ("2G", "channel"): "w_channel",
+        ("5G_1", "channel"): "w_channel_an",
+        ("2G", "bandwidth"): "opmode",
+        ("5G_1", "bandwidth"): "opmode_an",
+        ("2G", "security_type"): "security_type",
+        ("5G_1", "security_type"): "security_type_an",
+        ("2G", "password"): "passphrase",
+        ("5G_1", "password"): "passphrase_an"
+    }
+    _setting_keys = _setting_key_map(config_page_fields)
+
     def __init__(self, ap_settings):
         self.ap_settings = ap_settings.copy()
         self.log = logger.create_tagged_trace_logger("AccessPoint|{}".format(
@@ -636,8 +926,13 @@ class NetgearR7500AP(WifiRetailAP):
         self.init_gui_data()
         # Read and update AP settings
         self.read_ap_settings()
-        if not set(ap_settings.items()).issubset(self.ap_settings.items()):
-            self.update_ap_settings(ap_settings)
+        updated_settings = {
+            key: value
+            for key, value in ap_settings.items()
+            if self.ap_settings.get(key) != value
+        }
+        if updated_settings:
+            self.update_ap_settings(updated_settings)
 
     def init_gui_data(self):
         """Function to initialize data used while interacting with web GUI"""
@@ -664,21 +959,6 @@ class NetgearR7500AP(WifiRetailAP):
                 124, 128, 132, 136, 140, 149, 153, 157, 161, 165
             ]
         }
-        self.config_page_fields = {
-            "region": "WRegion",
-            ("2G", "status"): "enable_ap",
-            ("5G_1", "status"): "enable_ap_an",
-            ("2G", "ssid"): "ssid",
-            ("5G_1", "ssid"): "ssid_an",
-            ("2G", "channel"): "w_channel",
-            ("5G_1", "channel"): "w_channel_an",
-            ("2G", "bandwidth"): "opmode",
-            ("5G_1", "bandwidth"): "opmode_an",
-            ("2G", "security_type"): "security_type",
-            ("5G_1", "security_type"): "security_type_an",
-            ("2G", "password"): "passphrase",
-            ("5G_1", "password"): "passphrase_an"
-        }
         self.region_map = {
             "0": "Africa",
             "1": "Asia",
@@ -722,14 +1002,20 @@ class NetgearR7500AP(WifiRetailAP):
             "9": "VHT80"
         }
 
-    def read_ap_settings(self):
-        """Function to read ap wireless settings."""
-        # Get radio status (on/off)
-        self.read_radio_on_off()
-        # Get radio configuration. Note that if both radios are off, the below
-        # code will result in an error
-        with BlockingBrowser(self.ap_settings["headless_browser"],
-                             900) as browser:
+    def read_ap_settings(self, force=False, browser=None):
+        """Function to read ap wireless settings.
+
+        Args:
+            force: if True, re-read even if the cached settings are fresh
+            browser: open browser session to reuse, if any
+        """
+        if self._settings_cache_is_fresh(force):
+            return self.ap_settings.copy()
+        with self._open_browser(browser) as browser:
+            # Get radio status (on/off)
+            self.read_radio_on_off(browser=browser)
+            # Get radio configuration. Note that if both radios are off, the
+            # below code will result in an error
             browser.visit_persistent(
                 self.config_page,
                 BROWSER_WAIT_MED,
@@ -737,47 +1023,58 @@ class NetgearR7500AP(WifiRetailAP):
                 check_for_element="wireless")
             wireless_button = browser.find_by_id("wireless").first
             wireless_button.click()
-            time.sleep(BROWSER_WAIT_MED)
-
-            with browser.get_iframe("formframe") as iframe:
+            browser.wait_for_frame("formframe")
+
+            with browser.get_iframe("formframe"):
+                # Snapshot all fields of interest in one round trip and
+                # parse the result in Python, rather than issuing one
+                # WebDriver command per field.
+                field_values = browser.driver.execute_script(
+                    self._field_snapshot_js, [
+                        value
+                        for key, value in self.config_page_fields.items()
+                        if "status" not in key
+                    ])
                 for key, value in self.config_page_fields.items():
+                    if "status" in key:
+                        continue
+                    elements = field_values.get(value) or []
                     if "bandwidth" in key:
-                        config_item = iframe.find_by_name(value).first
-                        self.ap_settings["{}_{}".format(
-                            key[1],
-                            key[0])] = self.bw_mode_values[config_item.value]
+                        self.ap_settings[self._setting_keys[
+                            key]] = self.bw_mode_values[elements[0]["value"]]
                     elif "region" in key:
-                        config_item = iframe.find_by_name(value).first
                         self.ap_settings["region"] = self.region_map[
-                            config_item.value]
+                            elements[0]["value"]]
                     elif "password" in key:
-                        try:
-                            config_item = iframe.find_by_name(value).first
-                            self.ap_settings["{}_{}".format(
-                                key[1], key[0])] = config_item.value
-                            self.ap_settings["{}_{}".format(
-                                "security_type", key[0])] = "WPA2-PSK"
-                        except:
-                            self.ap_settings["{}_{}".format(
-                                key[1], key[0])] = "defaultpassword"
-                            self.ap_settings["{}_{}".format(
-                                "security_type", key[0])] = "Disable"
+                        security_key = self._setting_keys[(key[0],
+                                                           "security_type")]
+                        if elements:
+                            self.ap_settings[self._setting_keys[
+                                key]] = elements[0]["value"]
+                            self.ap_settings[security_key] = "WPA2-PSK"
+                        else:
+                            self.ap_settings[self._setting_keys[
+                                key]] = "defaultpassword"
+                            self.ap_settings[security_key] = "Disable"
                     elif ("channel" in key) or ("ssid" in key):
-                        config_item = iframe.find_by_name(value).first
-                        self.ap_settings["{}_{}".format(
-                            key[1], key[0])] = config_item.value
-                    else:
-                        pass
+                        self.ap_settings[self._setting_keys[
+                            key]] = elements[0]["value"]
+        self._settings_cache_ts = time.time()
         return self.ap_settings.copy()
 
-    def configure_ap(self, **config_flags):
-        """Function to configure ap wireless settings."""
-        # Turn radios on or off
-        if config_flags["status_toggled"]:
-            self.configure_radio_on_off()
-        # Configure radios
-        with BlockingBrowser(self.ap_settings["headless_browser"],
-                             900) as browser:
+    def configure_ap(self, browser=None, **config_flags):
+        """Function to configure ap wireless settings.
+
+        Args:
+            browser: open browser session to reuse, if any
+            config_flags: optional configuration flags
+        """
+        self._invalidate_settings_cache()
+        with self._open_browser(browser) as browser:
+            # Turn radios on or off
+            if config_flags["status_toggled"]:
+                self.configure_radio_on_off(browser=browser)
+            # Configure radios
             browser.visit_persistent(
                 self.config_page,
                 BROWSER_WAIT_MED,
@@ -785,64 +1082,57 @@ class NetgearR7500AP(WifiRetailAP):
                 check_for_element="wireless")
             wireless_button = browser.find_by_id("wireless").first
             wireless_button.click()
-            time.sleep(BROWSER_WAIT_MED)
+            browser.wait_for_frame("formframe")
 
             with browser.get_iframe("formframe") as iframe:
-                # Update AP region. Must be done before channel setting
-                config_item = iframe.find_by_name(
-                    self.config_page_fields["region"]).first
-                config_item.select_by_text(self.ap_settings["region"])
-                # Update wireless settings for each network
+                # Assemble all field writes and push them in a single
+                # round trip per batch. Region must be set before the
+                # channels, which the in-batch ordering guarantees.
+                config_fields = [(self.config_page_fields["region"],
+                                  "select_text", self.ap_settings["region"])]
                 for key, value in self.config_page_fields.items():
                     if "ssid" in key:
-                        config_item = iframe.find_by_name(value).first
-                        config_item.fill(self.ap_settings["{}_{}".format(
-                            key[1], key[0])])
+                        config_fields.append(
+                            (value, "fill",
+                             self.ap_settings[self._setting_keys[key]]))
                     elif "channel" in key:
-                        channel_string = "0" * (int(self.ap_settings[
-                            "{}_{}".format(key[1], key[0])]) < 10) + str(
-                                self.ap_settings["{}_{}".format(
-                                    key[1], key[0])]) + "(DFS)" * (48 < int(
-                                        self.ap_settings["{}_{}".format(
-                                            key[1], key[0])]) < 149)
-                        config_item = iframe.find_by_name(value).first
-                        try:
-                            config_item.select_by_text(channel_string)
-                        except AttributeError:
-                            self.log.warning(
-                                "Cannot select channel. Keeping AP default.")
+                        channel = self.ap_settings[self._setting_keys[key]]
+                        channel_string = "0" * (int(channel) < 10) + str(
+                            channel) + "(DFS)" * (48 < int(channel) < 149)
+                        config_fields.append(
+                            (value, "select_text", channel_string))
                     elif key == ("2G", "bandwidth"):
-                        config_item = iframe.find_by_name(value).first
-                        try:
-                            config_item.select_by_text(
-                                str(self.bw_mode_text_2g[self.ap_settings[
-                                    "{}_{}".format(key[1], key[0])]]))
-                        except AttributeError:
-                            self.log.warning(
-                                "Cannot select bandwidth. Keeping AP default.")
+                        config_fields.append(
+                            (value, "select_text",
+                             str(self.bw_mode_text_2g[self.ap_settings[
+                                 self._setting_keys[key]]])))
                     elif key == ("5G_1", "bandwidth"):
-                        config_item = iframe.find_by_name(value).first
-                        try:
-                            config_item.select_by_text(
-                                str(self.bw_mode_text_5g[self.ap_settings[
-                                    "{}_{}".format(key[1], key[0])]]))
-                        except AttributeError:
-                            self.log.warning(
-                                "Cannot select bandwidth. Keeping AP default.")
+                        config_fields.append(
+                            (value, "select_text",
+                             str(self.bw_mode_text_5g[self.ap_settings[
+                                 self._setting_keys[key]]])))
+                missed_fields = self._write_fields(browser, config_fields)
+                for field_name in missed_fields:
+                    self.log.warning(
+                        "Cannot set field {}. Keeping AP default.".format(
+                            field_name))
                 # Update passwords for WPA2-PSK protected networks
-                # (Must be done after security type is selected)
+                # (Must be done after security type is selected, which the
+                # in-batch ordering guarantees)
+                security_fields = []
                 for key, value in self.config_page_fields.items():
                     if "security_type" in key:
-                        iframe.choose(
-                            value, self.ap_settings["{}_{}".format(
-                                key[1], key[0])])
-                        if self.ap_settings["{}_{}".format(
-                                key[1], key[0])] == "WPA2-PSK":
-                            config_item = iframe.find_by_name(
-                                self.config_page_fields[(key[0],
-                                                         "password")]).first
-                            config_item.fill(self.ap_settings["{}_{}".format(
-                                "password", key[0])])
+                        security_type = self.ap_settings[
+                            self._setting_keys[key]]
+                        security_fields.append((value, "check",
+                                                security_type))
+                        if security_type == "WPA2-PSK":
+                            security_fields.append(
+                                (self.config_page_fields[(key[0],
+                                                          "password")],
+                                 "fill", self.ap_settings[self._setting_keys[(
+                                     key[0], "password")]]))
+                self._write_fields(browser, security_fields)
 
                 apply_button = iframe.find_by_name("Apply")
                 apply_button[0].click()
@@ -863,29 +1153,33 @@ class NetgearR7500AP(WifiRetailAP):
             browser.visit_persistent(self.config_page, BROWSER_WAIT_EXTRA_LONG,
                                      10)
 
-    def configure_radio_on_off(self):
-        """Helper configuration function to turn radios on/off."""
-        with BlockingBrowser(self.ap_settings["headless_browser"],
-                             900) as browser:
-            browser.visit_persistent(self.config_page, BROWSER_WAIT_MED, 10)
+    def configure_radio_on_off(self, browser=None):
+        """Helper configuration function to turn radios on/off.
+
+        Args:
+            browser: open browser session to reuse, if any
+        """
+        with self._open_browser(browser) as browser:
             browser.visit_persistent(
                 self.config_page_advanced,
                 BROWSER_WAIT_MED,
                 10,
+                backup_url=self.config_page,
                 check_for_element="advanced_bt")
             advanced_button = browser.find_by_id("advanced_bt").first
             advanced_button.click()
-            time.sleep(BROWSER_WAIT_MED)
+            WebDriverWait(browser.driver, BROWSER_WAIT_LONG).until(
+                expected_conditions.element_to_be_clickable((By.ID, "wladv")))
             wireless_button = browser.find_by_id("wladv").first
             wireless_button.click()
-            time.sleep(BROWSER_WAIT_MED)
+            browser.wait_for_frame("formframe")
 
             with browser.get_iframe("formframe") as iframe:
                 # Turn radios on or off
                 for key, value in self.config_page_fields.items():
                     if "status" in key:
                         config_item = iframe.find_by_name(value).first
-                        if self.ap_settings["{}_{}".format(key[1], key[0])]:
+                        if self.ap_settings[self._setting_keys[key]]:
                             config_item.check()
                         else:
                             config_item.uncheck()
@@ -896,29 +1190,33 @@ class NetgearR7500AP(WifiRetailAP):
                 browser.visit_persistent(self.config_page,
                                          BROWSER_WAIT_EXTRA_LONG, 10)
 
-    def read_radio_on_off(self):
-        """Helper configuration function to read radio status."""
-        with BlockingBrowser(self.ap_settings["headless_browser"],
-                             900) as browser:
-            browser.visit_persistent(self.config_page, BROWSER_WAIT_MED, 10)
+    def read_radio_on_off(self, browser=None):
+        """Helper configuration function to read radio status.
+
+        Args:
+            browser: open browser session to reuse, if any
+        """
+        with self._open_browser(browser) as browser:
             browser.visit_persistent(
                 self.config_page_advanced,
                 BROWSER_WAIT_MED,
                 10,
+                backup_url=self.config_page,
                 check_for_element="advanced_bt")
             advanced_button = browser.find_by_id("advanced_bt").first
             advanced_button.click()
-            time.sleep(BROWSER_WAIT_SHORT)
+            WebDriverWait(browser.driver, BROWSER_WAIT_LONG).until(
+                expected_conditions.element_to_be_clickable((By.ID, "wladv")))
             wireless_button = browser.find_by_id("wladv").first
             wireless_button.click()
-            time.sleep(BROWSER_WAIT_MED)
+            browser.wait_for_frame("formframe")
 
             with browser.get_iframe("formframe") as iframe:
                 # Turn radios on or off
                 for key, value in self.config_page_fields.items():
                     if "status" in key:
                         config_item = iframe.find_by_name(value).first
-                        self.ap_settings["{}_{}".format(key[1], key[0])] = int(
+                        self.ap_settings[self._setting_keys[key]] = int(
                             config_item.checked)
 
 
@@ -938,8 +1236,13 @@ class NetgearR7800AP(NetgearR7500AP):
         self.bw_mode_text_2g["VHT20"] = "Up to 347 Mbps"
         # Read and update AP settings
         self.read_ap_settings()
-        if not set(ap_settings.items()).issubset(self.ap_settings.items()):
-            self.update_ap_settings(ap_settings)
+        updated_settings = {
+            key: value
+            for key, value in ap_settings.items()
+            if self.ap_settings.get(key) != value
+        }
+        if updated_settings:
+            self.update_ap_settings(updated_settings)
 
 
 class NetgearR8000AP(NetgearR7000AP):
@@ -949,6 +1252,31 @@ class NetgearR8000AP(NetgearR7000AP):
     class inherits from NetgearR7000AP and simply redifines config parameters
     """
 
+    # The form field layout is fixed per AP model, so the mapping and its
+    # derived setting keys are shared by all instances of the class.
+    config_page_fields = {
+        "region": "WRegion",
+        ("2G", "status"): "enable_ap",
+        ("5G_1", "status"): "enable_ap_an",
+        ("5G_2", "status"): "enable_ap_an_2",
+        ("2G", "ssid"): "ssid",
+        ("5G_1", "ssid"): "ssid_an",
+        ("5G_2", "ssid"): "ssid_an_2",
+        ("2G", "channel"): "w_channel",
+        ("5G_1", "channel"): "w_channel_an",
+        ("5G_2", "channel"): "w_channel_an_2",
+        ("2G", "bandwidth"): "opmode",
+        ("5G_1", "bandwidth"): "opmode_an",
+        ("5G_2", "bandwidth"): "opmode_an_2",
+        ("2G", "security_type"): "security_type",
+        ("5G_1", "security_type"): "security_type_an",
+        ("5G_2", "security_type"): "security_type_an_2",
+        ("2G", "password"): "passphrase",
+        ("5G_1", "password"): "passphrase_an",
+        ("5G_2", "password"): "passphrase_an_2"
+    }
+    _setting_keys = _setting_key_map(config_page_fields)
+
     def __init__(self, ap_settings):
         self.ap_settings = ap_settings.copy()
         self.log = logger.create_tagged_trace_logger("AccessPoint|{}".format(
@@ -983,31 +1311,15 @@ class NetgearR8000AP(NetgearR7000AP):
             "5G_1": [36, 40, 44, 48],
             "5G_2": [149, 153, 157, 161, 165]
         }
-        self.config_page_fields = {
-            "region": "WRegion",
-            ("2G", "status"): "enable_ap",
-            ("5G_1", "status"): "enable_ap_an",
-            ("5G_2", "status"): "enable_ap_an_2",
-            ("2G", "ssid"): "ssid",
-            ("5G_1", "ssid"): "ssid_an",
-            ("5G_2", "ssid"): "ssid_an_2",
-            ("2G", "channel"): "w_channel",
-            ("5G_1", "channel"): "w_channel_an",
-            ("5G_2", "channel"): "w_channel_an_2",
-            ("2G", "bandwidth"): "opmode",
-            ("5G_1", "bandwidth"): "opmode_an",
-            ("5G_2", "bandwidth"): "opmode_an_2",
-            ("2G", "security_type"): "security_type",
-            ("5G_1", "security_type"): "security_type_an",
-            ("5G_2", "security_type"): "security_type_an_2",
-            ("2G", "password"): "passphrase",
-            ("5G_1", "password"): "passphrase_an",
-            ("5G_2", "password"): "passphrase_an_2"
-        }
         # Read and update AP settings
         self.read_ap_settings()
-        if not set(ap_settings.items()).issubset(self.ap_settings.items()):
-            self.update_ap_settings(ap_settings)
+        updated_settings = {
+            key: value
+            for key, value in ap_settings.items()
+            if self.ap_settings.get(key) != value
+        }
+        if updated_settings:
+            self.update_ap_settings(updated_settings)
 
 
 class NetgearR8500AP(NetgearR7000AP):
@@ -1017,6 +1329,31 @@ class NetgearR8500AP(NetgearR7000AP):
     class inherits from NetgearR7000AP and simply redifines config parameters
     """
 
+    # The form field layout is fixed per AP model, so the mapping and its
+    # derived setting keys are shared by all instances of the class.
+    config_page_fields = {
+        "region": "WRegion",
+        ("2G", "status"): "enable_ap",
+        ("5G_1", "status"): "enable_ap_an",
+        ("5G_2", "status"): "enable_ap_an_2",
+        ("2G", "ssid"): "ssid",
+        ("5G_1", "ssid"): "ssid_an",
+        ("5G_2", "ssid"): "ssid_an_2",
+        ("2G", "channel"): "w_channel",
+        ("5G_1", "channel"): "w_channel_an",
+        ("5G_2", "channel"): "w_channel_an_2",
+        ("2G", "bandwidth"): "opmode",
+        ("5G_1", "bandwidth"): "opmode_an",
+        ("5G_2", "bandwidth"): "opmode_an_2",
+        ("2G", "security_type"): "security_type",
+        ("5G_1", "security_type"): "security_type_an",
+        ("5G_2", "security_type"): "security_type_an_2",
+        ("2G", "password"): "passphrase",
+        ("5G_1", "password"): "passphrase_an",
+        ("5G_2", "password"): "passphrase_an_2"
+    }
+    _setting_keys = _setting_key_map(config_page_fields)
+
     def __init__(self, ap_settings):
         self.ap_settings = ap_settings.copy()
         self.log = logger.create_tagged_trace_logger("AccessPoint|{}".format(
@@ -1051,27 +1388,6 @@ class NetgearR8500AP(NetgearR7000AP):
             "5G_1": [36, 40, 44, 48],
             "5G_2": [149, 153, 157, 161, 165]
         }
-        self.config_page_fields = {
-            "region": "WRegion",
-            ("2G", "status"): "enable_ap",
-            ("5G_1", "status"): "enable_ap_an",
-            ("5G_2", "status"): "enable_ap_an_2",
-            ("2G", "ssid"): "ssid",
-            ("5G_1", "ssid"): "ssid_an",
-            ("5G_2", "ssid"): "ssid_an_2",
-            ("2G", "channel"): "w_channel",
-            ("5G_1", "channel"): "w_channel_an",
-            ("5G_2", "channel"): "w_channel_an_2",
-            ("2G", "bandwidth"): "opmode",
-            ("5G_1", "bandwidth"): "opmode_an",
-            ("5G_2", "bandwidth"): "opmode_an_2",
-            ("2G", "security_type"): "security_type",
-            ("5G_1", "security_type"): "security_type_an",
-            ("5G_2", "security_type"): "security_type_an_2",
-            ("2G", "password"): "passphrase",
-            ("5G_1", "password"): "passphrase_an",
-            ("5G_2", "password"): "passphrase_an_2"
-        }
         self.bw_mode_text = {
             "11g": "Up to 54 Mbps",
             "VHT20": "Up to 433 Mbps",
@@ -1080,8 +1396,13 @@ class NetgearR8500AP(NetgearR7000AP):
         }
         # Read and update AP settings
         self.read_ap_settings()
-        if not set(ap_settings.items()).issubset(self.ap_settings.items()):
-            self.update_ap_settings(ap_settings)
+        updated_settings = {
+            key: value
+            for key, value in ap_settings.items()
+            if self.ap_settings.get(key) != value
+        }
+        if updated_settings:
+            self.update_ap_settings(updated_settings)
 
 
 class GoogleWifiAP(WifiRetailAP):
@@ -1143,8 +1464,12 @@ class GoogleWifiAP(WifiRetailAP):
         self.access_point = access_point.AccessPoint(init_settings)
         self.configure_ap()
 
-    def read_ap_settings(self):
-        """Function that reads current ap settings."""
+    def read_ap_settings(self, force=False):
+        """Function that reads current ap settings.
+
+        Args:
+            force: unused; settings are always served from memory
+        """
         return self.ap_settings.copy()
 
     def update_ap_settings(self, dict_settings={}, **named_settings):
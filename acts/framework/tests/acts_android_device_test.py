@@ -20,6 +20,7 @@ import os
 import shutil
 import tempfile
 import unittest
+import zipfile
 
 from acts import logger
 from acts.controllers import android_device
@@ -84,10 +85,6 @@ class MockAdbProxy(object):
     def shell(self, params, ignore_status=False, timeout=60):
         if params == "id -u":
             return "root"
-        elif params == "bugreportz":
-            if self.fail_br:
-                return "OMG I died!\n"
-            return "OK:/path/bugreport.zip\n"
         elif params == "bugreportz -v":
             if self.fail_br_before_N:
                 return "/system/bin/sh: bugreportz: not found"
@@ -110,9 +107,31 @@ class MockAdbProxy(object):
         elif params == "sys.boot_completed":
             return "1"
 
+    def getprops(self):
+        return {
+            "ro.build.id": self.build_id,
+            "ro.build.version.incremental": "123456789",
+            "ro.build.type": "userdebug",
+            "ro.build.product": "FakeModel",
+            "ro.product.name": "FakeModel",
+            "sys.boot_completed": "1"
+        }
+
     def devices(self):
         return "\t".join([str(self.serial), "device"])
 
+    def exec_out(self, params, timeout=android_device.BUG_REPORT_TIMEOUT):
+        if params.startswith("bugreportz -s"):
+            out_path = params.split("> ")[1].strip('"')
+            os.makedirs(os.path.dirname(out_path), exist_ok=True)
+            if self.fail_br:
+                with open(out_path, "w") as f:
+                    f.write("OMG I died!\n")
+            else:
+                # Stream an (empty) zip like bugreportz -s would.
+                zipfile.ZipFile(out_path, "w").close()
+        return ""
+
     def bugreport(self, params, timeout=android_device.BUG_REPORT_TIMEOUT):
         expected = os.path.join(
             logging.log_path, "AndroidDevice%s" % self.serial,
@@ -162,6 +181,10 @@ class ActsAndroidDeviceTest(unittest.TestCase):
             setattr(logging, "log_path", "/tmp/logs")
         # Creates a temp dir to be used by tests in this test class.
         self.tmp_dir = tempfile.mkdtemp()
+        # Make sure state cached by a previous test (possibly with different
+        # mocks) is not served to this one.
+        android_device.invalidate_device_list_cache()
+        android_device.AndroidDevice._bugreportz_support.clear()
 
     def tearDown(self):
         """Removes the temp dir.
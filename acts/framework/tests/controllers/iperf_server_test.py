@@ -101,8 +101,9 @@ class IPerfServerBaseTest(unittest.TestCase):
 class IPerfServerTest(unittest.TestCase):
     """Tests acts.controllers.iperf_server.IPerfServer."""
 
+    @mock.patch('builtins.open')
     @mock.patch('acts.utils.start_standing_subprocess')
-    def test_start_makes_started_true(self, _):
+    def test_start_makes_started_true(self, _, __):
         """Tests calling start() without calling stop() makes started True."""
         server = IPerfServer('port')
         server._get_full_file_path = lambda _: MOCK_LOGFILE_PATH
@@ -110,9 +111,10 @@ class IPerfServerTest(unittest.TestCase):
 
         self.assertTrue(server.started)
 
+    @mock.patch('builtins.open')
     @mock.patch('acts.utils.start_standing_subprocess')
     @mock.patch('acts.utils.stop_standing_subprocess')
-    def test_start_stop_makes_started_false(self, _, __):
+    def test_start_stop_makes_started_false(self, _, __, ___):
         """Tests calling start() without calling stop() makes started True."""
         server = IPerfServer('port')
         server._get_full_file_path = lambda _: MOCK_LOGFILE_PATH
@@ -122,8 +124,9 @@ class IPerfServerTest(unittest.TestCase):
 
         self.assertFalse(server.started)
 
+    @mock.patch('builtins.open')
     @mock.patch('acts.utils.start_standing_subprocess')
-    def test_start_sets_current_log_file(self, _):
+    def test_start_sets_current_log_file(self, _, __):
         server = IPerfServer('port')
         server._get_full_file_path = lambda _: MOCK_LOGFILE_PATH
 
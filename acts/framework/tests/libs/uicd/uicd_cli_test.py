@@ -13,30 +13,56 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
+import contextlib
 import mock
+import os
 import unittest
 
 from acts.libs.uicd.uicd_cli import UicdCli
 from acts.libs.uicd.uicd_cli import UicdError
 
-_MOCK_WALK = {'/dir1': [('/dir1', (), ('file1', 'file2'))],
-              '/dir2': [('/dir2', ('dir3',), ('file3',)),
-                        ('/dir2/dir3', (), ())],
-              '/dir3': [('/dir3', (), ('file1',))]}
 
+class _MockDirEntry(object):
+    """Stand-in for os.DirEntry, as returned by os.scandir."""
 
-def _mock_walk(path, **_):
-    return _MOCK_WALK.get(path, [])
+    def __init__(self, path, is_dir=False):
+        self.path = path
+        self.name = path.rsplit('/', 1)[-1]
+        self._is_dir = is_dir
+
+    def is_dir(self, follow_symlinks=True):
+        return self._is_dir
+
+
+_MOCK_SCANDIR = {'/dir1': [_MockDirEntry('/dir1/file1'),
+                           _MockDirEntry('/dir1/file2')],
+                 '/dir2': [_MockDirEntry('/dir2/dir3', is_dir=True),
+                           _MockDirEntry('/dir2/file3')],
+                 '/dir2/dir3': [_MockDirEntry('/dir2/dir3/file4')],
+                 '/dir3': [_MockDirEntry('/dir3/file1')]}
+
+
+def _mock_scandir(path):
+    return contextlib.nullcontext(_MOCK_SCANDIR.get(path, []))
+
+
+# A stat result with a fixed mtime, for the workflow-scan fingerprint.
+_MOCK_STAT = os.stat_result(range(10), {'st_mtime_ns': 0})
 
 
 class UicdCliTest(unittest.TestCase):
     """Tests the acts.libs.uicd.uicd_cli.UicdCli class."""
 
+    def setUp(self):
+        # Keep the class-level workflow cache from leaking between tests.
+        UicdCli.clear_workflow_cache()
+
     # _set_workflows
 
-    @mock.patch('os.walk', _mock_walk)
+    @mock.patch('os.stat', return_value=_MOCK_STAT)
+    @mock.patch('os.scandir', _mock_scandir)
     @mock.patch('os.makedirs')
-    @mock.patch('tempfile.mkdtemp')
+    @mock.patch('tempfile.mkdtemp', return_value='/base')
     @mock.patch('shutil.rmtree')
     @mock.patch.object(UicdCli, '_setup_cli')
     def test_set_workflows_sets_correct_file_path(self, *_):
@@ -47,9 +73,10 @@ class UicdCliTest(unittest.TestCase):
         self.assertEqual(nc._workflows['file1'], '/dir1/file1',
                          'Workflow name does not point to the correct path.')
 
-    @mock.patch('os.walk', _mock_walk)
+    @mock.patch('os.stat', return_value=_MOCK_STAT)
+    @mock.patch('os.scandir', _mock_scandir)
     @mock.patch('os.makedirs')
-    @mock.patch('tempfile.mkdtemp')
+    @mock.patch('tempfile.mkdtemp', return_value='/base')
     @mock.patch('shutil.rmtree')
     @mock.patch.object(UicdCli, '_setup_cli')
     def test_set_workflows_adds_workflows_from_directories(self, *_):
@@ -64,9 +91,10 @@ class UicdCliTest(unittest.TestCase):
             self.assertNotIn(dir_name, nc._workflows,
                              'Directories should not be added to dictionary.')
 
-    @mock.patch('os.walk', _mock_walk)
+    @mock.patch('os.stat', return_value=_MOCK_STAT)
+    @mock.patch('os.scandir', _mock_scandir)
     @mock.patch('os.makedirs')
-    @mock.patch('tempfile.mkdtemp')
+    @mock.patch('tempfile.mkdtemp', return_value='/base')
     @mock.patch('shutil.rmtree')
     @mock.patch.object(UicdCli, '_setup_cli')
     def test_set_workflows_rejects_duplicate_workflow_names(self, *_):
@@ -77,6 +105,20 @@ class UicdCliTest(unittest.TestCase):
         with self.assertRaisesRegex(UicdError, expected_msg):
             nc = UicdCli('', ['/dir1', '/dir3'])
 
+    @mock.patch('os.stat', return_value=_MOCK_STAT)
+    @mock.patch('os.scandir', _mock_scandir)
+    @mock.patch('os.makedirs')
+    @mock.patch('tempfile.mkdtemp', return_value='/base')
+    @mock.patch('shutil.rmtree')
+    @mock.patch.object(UicdCli, '_setup_cli')
+    def test_set_workflows_nonrecursive_skips_subdirectories(self, *_):
+        """Tests that recursive=False only scans the top directory level."""
+        nc = UicdCli('', ['/dir2'], recursive=False)
+        self.assertIn('file3', nc._workflows,
+                      'Top-level workflow file not added to dictionary.')
+        self.assertNotIn('file4', nc._workflows,
+                         'Files in subdirectories should not be added.')
+
     # run
 
     @mock.patch('os.makedirs')
@@ -17,10 +17,13 @@
 Sanity tests for connectivity tests in telephony
 """
 
+import fcntl
 import time
 import json
 import logging
 import os
+import socket
+import struct
 
 from acts.test_decorators import test_tracker_info
 from acts.controllers.anritsu_lib._anritsu_utils import AnritsuError
@@ -60,6 +63,7 @@ from acts.test_utils.tel.tel_test_utils import ensure_network_rat
 from acts.test_utils.tel.tel_test_utils import ensure_phones_idle
 from acts.test_utils.tel.tel_test_utils import ensure_network_generation
 from acts.test_utils.tel.tel_test_utils import toggle_airplane_mode
+from acts.test_utils.tel.tel_test_utils import wait_for_data_attach
 from acts.test_utils.tel.tel_test_utils import iperf_test_by_adb
 from acts.test_utils.tel.tel_test_utils import start_qxdm_loggers
 from acts.test_utils.tel.tel_test_utils import verify_http_connection
@@ -77,13 +81,25 @@ from acts.test_utils.tel.TelephonyBaseTest import TelephonyBaseTest
 from acts.utils import adb_shell_ping
 from acts.utils import rand_ascii_str
 from acts.controllers import iperf_server
-from acts.utils import exe_cmd
 
-DEFAULT_PING_DURATION = 30
+# Number of ICMP packets for the pre-iperf link check. The link is
+# either up or it is not; a short ping is as conclusive as a long one.
+SHORT_PING_DURATION = 5
+# Window within which a recent successful ping/iperf to the same
+# destination lets the link check be skipped entirely.
+LINK_VERIFY_WINDOW = 60
 
 
 class TelLabDataTest(TelephonyBaseTest):
-    SETTLING_TIME = 30
+    # Upper bounds for the post-registration data-attach poll. Attach
+    # latency differs widely by technology, so the bound is per RAT
+    # rather than a single class-wide worst case.
+    SETTLING_TIMES = {
+        RAT_LTE: 10,
+        RAT_WCDMA: 15,
+        RAT_GSM: 15,
+        RAT_1XRTT: 25
+    }
     SERIAL_NO = cb_serial_number()
 
     def __init__(self, controllers):
@@ -105,6 +121,8 @@ class TelLabDataTest(TelephonyBaseTest):
         self.MAX_ITERATIONS = abs(int((self.stop_power_level - \
                                  self.start_power_level) / self.step_size))
         self.log.info("Max iterations is %d", self.MAX_ITERATIONS)
+        self._last_link_dest = None
+        self._last_successful_link_ts = 0
 
     def setup_class(self):
         try:
@@ -113,8 +131,35 @@ class TelLabDataTest(TelephonyBaseTest):
         except AnritsuError:
             self.log.error("Error in connecting to Anritsu Simulator")
             return False
+        # Start the iperf server once for the whole class; tests reuse the
+        # running server rather than paying process startup and port
+        # binding on every iteration.
+        if not self.ip_server.started:
+            self.ip_server.start(tag="TelLabData")
+        # Fetch IP address of the host machine once; it does not change
+        # over the lifetime of the test class.
+        self.destination_ip = self._get_host_ip_address()
+        self.log.info("Dest IP is %s", self.destination_ip)
         return True
 
+    def _get_host_ip_address(self):
+        """Returns the host machine's IPv4 address.
+
+        Queries the kernel directly for the eth0 address instead of
+        shelling out to an ifconfig/grep/cut pipeline. Falls back to the
+        address used to route external traffic on hosts where eth0 does
+        not exist.
+        """
+        SIOCGIFADDR = 0x8915
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            try:
+                return socket.inet_ntoa(
+                    fcntl.ioctl(sock.fileno(), SIOCGIFADDR,
+                                struct.pack("256s", b"eth0"))[20:24])
+            except OSError:
+                sock.connect(("8.8.8.8", 80))
+                return sock.getsockname()[0]
+
     def setup_test(self):
         if getattr(self, "qxdm_log", True):
             start_qxdm_loggers(self.log, self.android_devices)
@@ -129,9 +174,39 @@ class TelLabDataTest(TelephonyBaseTest):
         return True
 
     def teardown_class(self):
+        if self.ip_server.started:
+            self.ip_server.stop()
         self.anritsu.disconnect()
         return True
 
+    def _verify_link(self, destination_ip):
+        """Confirms the device can reach the iperf host.
+
+        The check is skipped entirely if traffic to the same destination
+        succeeded within the last LINK_VERIFY_WINDOW seconds; otherwise a
+        short ping is run.
+
+        Args:
+            destination_ip: IP address of the iperf host
+
+        Returns:
+            True if the link is up, False otherwise.
+        """
+        if (self._last_link_dest == destination_ip and time.time() -
+                self._last_successful_link_ts < LINK_VERIFY_WINDOW):
+            self.log.info("Link to %s verified recently, skipping ping.",
+                          destination_ip)
+            return True
+        if not adb_shell_ping(self.ad, SHORT_PING_DURATION, destination_ip):
+            return False
+        self._record_link_success(destination_ip)
+        return True
+
+    def _record_link_success(self, destination_ip):
+        """Records that traffic to the destination just succeeded."""
+        self._last_link_dest = destination_ip
+        self._last_successful_link_ts = time.time()
+
     def _setup_data(self, set_simulation_func, rat):
         try:
             [self.bts1] = set_simulation_func(self.anritsu, self.user_params,
@@ -178,17 +253,16 @@ class TelLabDataTest(TelephonyBaseTest):
                 return False
 
             self.anritsu.wait_for_registration_state()
-            time.sleep(self.SETTLING_TIME)
+            # Poll for data attach rather than sleeping for the full
+            # settling time; the device is typically ready much earlier.
+            settling_time = self.SETTLING_TIMES[rat]
+            if not wait_for_data_attach(self.log, self.ad, settling_time):
+                self.log.warning("Device not attached on data within %s s.",
+                                 settling_time)
 
-            # Fetch IP address of the host machine
-            cmd = "|".join(("ifconfig", "grep eth0 -A1", "grep inet",
-                            "cut -d ':' -f2", "cut -d ' ' -f 1"))
-            destination_ip = exe_cmd(cmd)
-            destination_ip = (destination_ip.decode("utf-8")).split("\n")[0]
-            self.log.info("Dest IP is %s", destination_ip)
+            destination_ip = self.destination_ip
 
-            if not adb_shell_ping(self.ad, DEFAULT_PING_DURATION,
-                                  destination_ip):
+            if not self._verify_link(destination_ip):
                 self.log.error("Pings failed to Destination.")
                 return False
             self.bts1.output_level = self.start_power_level
@@ -200,7 +274,6 @@ class TelLabDataTest(TelephonyBaseTest):
                 current_power = self.bts1.output_level
                 self.log.info("Current Power Level is %s", current_power)
 
-                self.ip_server.start()
                 tput_dict = {"Uplink": 0, "Downlink": 0}
                 if iperf_test_by_adb(
                         self.log,
@@ -212,6 +285,7 @@ class TelLabDataTest(TelephonyBaseTest):
                         rate_dict=tput_dict):
                     uplink = tput_dict["Uplink"]
                     downlink = tput_dict["Downlink"]
+                    self._record_link_success(destination_ip)
                 else:
                     self.log.error("iperf failed to Destination.")
                     self.log.info("Iteration %d Failed", iteration)
@@ -219,7 +293,6 @@ class TelLabDataTest(TelephonyBaseTest):
                         return True
                     else:
                         return False
-                self.ip_server.stop()
 
                 self.log.info("Iteration %d Passed", iteration)
                 self.logpath = os.path.join(logging.log_path, "power_tput.txt")
@@ -280,7 +353,12 @@ class TelLabDataTest(TelephonyBaseTest):
                 return False
 
             self.anritsu.wait_for_registration_state()
-            time.sleep(self.SETTLING_TIME)
+            # Poll for data attach rather than sleeping for the full
+            # settling time; the device is typically ready much earlier.
+            settling_time = self.SETTLING_TIMES[rat]
+            if not wait_for_data_attach(self.log, self.ad, settling_time):
+                self.log.warning("Device not attached on data within %s s.",
+                                 settling_time)
 
             self.bts1.output_level = self.start_power_level
 
@@ -15,6 +15,7 @@
 #   limitations under the License.
 
 import collections
+import functools
 import itertools
 import json
 import os
@@ -26,6 +27,27 @@ from acts.test_utils.wifi import wifi_performance_test_utils as wputils
 from WifiRvrTest import WifiRvrTest
 from WifiPingTest import WifiPingTest
 
+# Channels supported per bandwidth mode, shared by the RvR and ping test
+# generators. frozensets give O(1) membership checks while filtering.
+_ALLOWED_CONFIGS = {
+    'VHT20':
+    frozenset({
+        1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 36, 40, 44, 48, 149, 153, 157, 161
+    }),
+    'VHT40': frozenset({36, 44, 149, 157}),
+    'VHT80': frozenset({36, 149})
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_test_name(test_name):
+    """Splits a test name into its underscore-delimited tokens.
+
+    parse_test_params runs once per generated test over grids of 1000+
+    names, so the split result is cached per name.
+    """
+    return tuple(test_name.split('_'))
+
 
 class WifiOtaRvrTest(WifiRvrTest):
     """Class to test over-the-air RvR
@@ -67,30 +89,52 @@ class WifiOtaRvrTest(WifiRvrTest):
         # Call parent parsing function
         testcase_params = WifiRvrTest.parse_test_params(self, test_name)
         # Add orientation information
-        test_name_params = test_name.split('_')
+        test_name_params = _split_test_name(test_name)
         testcase_params['orientation'] = int(test_name_params[6][0:-3])
         return testcase_params
 
+    def __getattr__(self, name):
+        """Resolves generated test cases to the shared test method.
+
+        Generated test names are registered by name rather than being
+        materialized as one bound-method attribute per name in the
+        instance dict, so all cases share a single method lookup.
+        """
+        if name in self.__dict__.get('_generated_test_cases', ()):
+            return self._test_rvr
+        raise AttributeError(name)
+
     def generate_test_cases(self, channels, modes, angles, traffic_types,
                             directions):
-        test_cases = []
-        testcase_wrapper = self._test_rvr
-        allowed_configs = {
-            'VHT20': [
-                1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 36, 40, 44, 48, 149, 153,
-                157, 161
-            ],
-            'VHT40': [36, 44, 149, 157],
-            'VHT80': [36, 149]
-        }
-        for channel, mode, angle, traffic_type, direction in itertools.product(
-                channels, modes, angles, traffic_types, directions):
-            if channel not in allowed_configs[mode]:
-                continue
-            testcase_name = 'test_rvr_{}_{}_ch{}_{}_{}deg'.format(
-                traffic_type, direction, channel, mode, angle)
-            setattr(self, testcase_name, testcase_wrapper)
-            test_cases.append(testcase_name)
+        # The inputs are literal constants per subclass, so the expanded
+        # grid is cached on the class and shared across instantiations.
+        cls = type(self)
+        cache_key = (tuple(channels), tuple(modes), tuple(angles),
+                     tuple(traffic_types), tuple(directions))
+        if '_test_case_cache' not in cls.__dict__:
+            cls._test_case_cache = {}
+        if cache_key in cls._test_case_cache:
+            test_cases, self._generated_test_cases = cls._test_case_cache[
+                cache_key]
+            return test_cases
+        # Filter out unsupported channel/mode pairs before expanding the
+        # product, rather than generating and rejecting tuples one at a
+        # time over the full grid. The allowed-channel set is resolved
+        # once per mode rather than per pair.
+        mode_sets = [(mode, _ALLOWED_CONFIGS[mode]) for mode in modes]
+        channel_mode_pairs = [(channel, mode) for channel in channels
+                              for mode, allowed in mode_sets
+                              if channel in allowed]
+        test_cases = [
+            f'test_rvr_{traffic_type}_{direction}_ch{channel}_{mode}_'
+            f'{angle}deg'
+            for (channel, mode), angle, traffic_type, direction in
+            itertools.product(channel_mode_pairs, angles, traffic_types,
+                              directions)
+        ]
+        self._generated_test_cases = set(test_cases)
+        cls._test_case_cache[cache_key] = (test_cases,
+                                           self._generated_test_cases)
         return test_cases
 
 
@@ -190,8 +234,7 @@ class WifiOtaPingTest(WifiPingTest):
         # Configure AP
         self.setup_ap(testcase_params)
         # Set attenuator to 0 dB
-        for attenuator in self.attenuators:
-            attenuator.set_atten(0, strict=False)
+        wputils.set_atten_all(self.attenuators, 0, strict=False)
         # Setup turntable
         self.ota_chamber.set_orientation(testcase_params['orientation'])
         # Reset, configure, and connect DUT
@@ -202,28 +245,48 @@ class WifiOtaPingTest(WifiPingTest):
         # Call parent parsing function
         testcase_params = WifiPingTest.parse_test_params(self, test_name)
         # Add orientation information
-        test_name_params = test_name.split('_')
+        test_name_params = _split_test_name(test_name)
         testcase_params['orientation'] = int(test_name_params[5][0:-3])
         return testcase_params
 
+    def __getattr__(self, name):
+        """Resolves generated test cases to the shared test method.
+
+        Generated test names are registered by name rather than being
+        materialized as one bound-method attribute per name in the
+        instance dict, so all cases share a single method lookup.
+        """
+        if name in self.__dict__.get('_generated_test_cases', ()):
+            return self._test_ping_range
+        raise AttributeError(name)
+
     def generate_test_cases(self, channels, modes, angles):
-        test_cases = []
-        testcase_wrapper = self._test_ping_range
-        allowed_configs = {
-            'VHT20': [
-                1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 36, 40, 44, 48, 149, 153,
-                157, 161
-            ],
-            'VHT40': [36, 44, 149, 157],
-            'VHT80': [36, 149]
-        }
-        for channel, mode, angle in itertools.product(channels, modes, angles):
-            if channel not in allowed_configs[mode]:
-                continue
-            testcase_name = 'test_ping_range_ch{}_{}_{}deg'.format(
-                channel, mode, angle)
-            setattr(self, testcase_name, testcase_wrapper)
-            test_cases.append(testcase_name)
+        # The inputs are literal constants per subclass, so the expanded
+        # grid is cached on the class and shared across instantiations.
+        cls = type(self)
+        cache_key = (tuple(channels), tuple(modes), tuple(angles))
+        if '_test_case_cache' not in cls.__dict__:
+            cls._test_case_cache = {}
+        if cache_key in cls._test_case_cache:
+            test_cases, self._generated_test_cases = cls._test_case_cache[
+                cache_key]
+            return test_cases
+        # Filter out unsupported channel/mode pairs before expanding the
+        # product, rather than generating and rejecting tuples one at a
+        # time over the full grid. The allowed-channel set is resolved
+        # once per mode rather than per pair.
+        mode_sets = [(mode, _ALLOWED_CONFIGS[mode]) for mode in modes]
+        channel_mode_pairs = [(channel, mode) for channel in channels
+                              for mode, allowed in mode_sets
+                              if channel in allowed]
+        test_cases = [
+            f'test_ping_range_ch{channel}_{mode}_{angle}deg'
+            for (channel, mode), angle in itertools.product(
+                channel_mode_pairs, angles)
+        ]
+        self._generated_test_cases = set(test_cases)
+        cls._test_case_cache[cache_key] = (test_cases,
+                                           self._generated_test_cases)
         return test_cases
 
 
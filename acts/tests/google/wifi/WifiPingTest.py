@@ -306,8 +306,7 @@ class WifiPingTest(base_test.BaseTestClass):
         # Run ping and sweep attenuation as needed
         zero_counter = 0
         for atten in testcase_params["atten_range"]:
-            for attenuator in self.attenuators:
-                attenuator.set_atten(atten, strict=False)
+            wputils.set_atten_all(self.attenuators, atten, strict=False)
             rssi_future = wputils.get_connected_rssi_nb(
                 self.client_dut,
                 int(testcase_params["ping_duration"] / 2 /
@@ -398,8 +397,7 @@ class WifiPingTest(base_test.BaseTestClass):
         # Configure AP
         self.setup_ap(testcase_params)
         # Set attenuator to 0 dB
-        for attenuator in self.attenuators:
-            attenuator.set_atten(0, strict=False)
+        wputils.set_atten_all(self.attenuators, 0, strict=False)
         # Reset, configure, and connect DUT
         self.setup_dut(testcase_params)
 
@@ -297,8 +297,7 @@ class WifiRvrTest(base_test.BaseTestClass):
         rssi = []
         for atten in testcase_params["atten_range"]:
             # Set Attenuation
-            for attenuator in self.attenuators:
-                attenuator.set_atten(atten, strict=False)
+            wputils.set_atten_all(self.attenuators, atten, strict=False)
             # Start iperf session
             self.iperf_server.start(tag=str(atten))
             rssi_future = wputils.get_connected_rssi_nb(
@@ -340,8 +339,7 @@ class WifiRvrTest(base_test.BaseTestClass):
                     [0] *
                     (len(testcase_params["atten_range"]) - len(throughput)))
                 break
-        for attenuator in self.attenuators:
-            attenuator.set_atten(0, strict=False)
+        wputils.set_atten_all(self.attenuators, 0, strict=False)
         # Compile test result and meta data
         rvr_result = collections.OrderedDict()
         rvr_result["test_name"] = self.current_test_name
@@ -405,8 +403,7 @@ class WifiRvrTest(base_test.BaseTestClass):
         # Configure AP
         self.setup_ap(testcase_params)
         # Set attenuator to 0 dB
-        for attenuator in self.attenuators:
-            attenuator.set_atten(0, strict=False)
+        wputils.set_atten_all(self.attenuators, 0, strict=False)
         # Reset, configure, and connect DUT
         self.setup_dut(testcase_params)
         # Get iperf_server address
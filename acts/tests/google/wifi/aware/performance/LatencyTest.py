@@ -14,9 +14,14 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+import collections
+import itertools
 import queue
+import random
 import time
 
+from concurrent.futures import ThreadPoolExecutor
+
 from acts import asserts
 from acts.test_utils.net import connectivity_const as cconsts
 from acts.test_utils.wifi.aware import aware_const as aconsts
@@ -33,8 +38,60 @@ class LatencyTest(AwareBaseTest):
     # take some time
     WAIT_FOR_CLUSTER = 5
 
+    # number of seconds to wait after changing the DW configuration on an
+    # already formed cluster - much shorter than a full cluster formation
+    WAIT_FOR_DW_CHANGE = 0.5
+
     def __init__(self, controllers):
         AwareBaseTest.__init__(self, controllers)
+        # Last DW configuration pushed to each device, keyed by serial.
+        # Configuring the DW issues several blocking shell commands per
+        # device, so pushing an unchanged configuration is skipped.
+        self._dw_config_cache = {}
+
+    def setup_test(self):
+        # The base class resets Aware device parameters, which clears any
+        # DW configuration previously pushed to the devices.
+        self._dw_config_cache.clear()
+        AwareBaseTest.setup_test(self)
+
+    def config_dw_settings(self, dut, dw_24ghz, dw_5ghz):
+        """Configure a device's DW settings unless already applied.
+
+    Args:
+      dut: Device to configure.
+      dw_24ghz: DW interval in the 2.4GHz band.
+      dw_5ghz: DW interval in the 5GHz band.
+
+    Returns:
+      True if the configuration was pushed, False if it was already set.
+    """
+        if self._dw_config_cache.get(dut.serial) == (dw_24ghz, dw_5ghz):
+            return False
+        autils.config_power_settings(dut, dw_24ghz, dw_5ghz)
+        self._dw_config_cache[dut.serial] = (dw_24ghz, dw_5ghz)
+        return True
+
+    def config_dw_settings_on_duts(self, duts, dw_24ghz, dw_5ghz):
+        """Configure the DW settings on several devices concurrently.
+
+    The devices are independent, so the per-device shell commands are
+    issued in parallel rather than back to back.
+
+    Args:
+      duts: Devices to configure.
+      dw_24ghz: DW interval in the 2.4GHz band.
+      dw_5ghz: DW interval in the 5GHz band.
+
+    Returns:
+      True if the configuration was pushed to any device.
+    """
+        with ThreadPoolExecutor(max_workers=len(duts)) as executor:
+            return any(
+                list(
+                    executor.map(
+                        lambda dut: self.config_dw_settings(
+                            dut, dw_24ghz, dw_5ghz), duts)))
 
     def start_discovery_session(self, dut, session_id, is_publish, dtype):
         """Start a discovery session
@@ -93,8 +150,7 @@ class LatencyTest(AwareBaseTest):
         s_dut.pretty_name = "Subscriber"
 
         # override the default DW configuration
-        autils.config_power_settings(p_dut, dw_24ghz, dw_5ghz)
-        autils.config_power_settings(s_dut, dw_24ghz, dw_5ghz)
+        self.config_dw_settings_on_duts((p_dut, s_dut), dw_24ghz, dw_5ghz)
 
         latencies = []
         failed_discoveries = 0
@@ -128,7 +184,7 @@ class LatencyTest(AwareBaseTest):
             except queue.Empty:
                 s_dut.log.info("[Subscriber] Timed out while waiting for "
                                "SESSION_CB_ON_SERVICE_DISCOVERED")
-                failed_discoveries = failed_discoveries + 1
+                failed_discoveries += 1
                 continue
             finally:
                 # destroy sessions
@@ -153,47 +209,83 @@ class LatencyTest(AwareBaseTest):
                "Solicited/Active", dw_24ghz, dw_5ghz))
         results[key]["num_failed_discovery"] = failed_discoveries
 
-    def run_discovery_latency(self, results, do_unsolicited_passive, dw_24ghz,
-                              dw_5ghz, num_iterations):
-        """Run the service discovery latency test with the specified DW intervals.
+    def _prepare_discovery_session(self, do_unsolicited_passive):
+        """Attach both devices and start a publish session.
 
     Args:
-      results: Result array to be populated - will add results (not erase it)
       do_unsolicited_passive: True for unsolicited/passive, False for
                               solicited/active.
-      dw_24ghz: DW interval in the 2.4GHz band.
-      dw_5ghz: DW interval in the 5GHz band.
-    """
-        key = "%s_dw24_%d_dw5_%d" % ("unsolicited_passive"
-                                     if do_unsolicited_passive else
-                                     "solicited_active", dw_24ghz, dw_5ghz)
-        results[key] = {}
-        results[key]["num_iterations"] = num_iterations
 
+    Returns:
+      Dict with the devices and session ids, for use with
+      _measure_discovery_latency.
+    """
         p_dut = self.android_devices[0]
         p_dut.pretty_name = "Publisher"
         s_dut = self.android_devices[1]
         s_dut.pretty_name = "Subscriber"
 
-        # override the default DW configuration
-        autils.config_power_settings(p_dut, dw_24ghz, dw_5ghz)
-        autils.config_power_settings(s_dut, dw_24ghz, dw_5ghz)
-
-        # Publisher+Subscriber: attach and wait for confirmation
-        p_id = p_dut.droid.wifiAwareAttach(False)
+        # Publisher+Subscriber: attach (with identity callbacks) and wait
+        # for confirmation
+        start_time = time.time()
+        p_id = p_dut.droid.wifiAwareAttach(True)
         autils.wait_for_event(p_dut, aconsts.EVENT_CB_ON_ATTACHED)
         time.sleep(self.device_startup_offset)
-        s_id = s_dut.droid.wifiAwareAttach(False)
+        s_id = s_dut.droid.wifiAwareAttach(True)
         autils.wait_for_event(s_dut, aconsts.EVENT_CB_ON_ATTACHED)
 
         # start publish
-        p_disc_event = self.start_discovery_session(
+        self.start_discovery_session(
             p_dut, p_id, True, aconsts.PUBLISH_TYPE_UNSOLICITED
             if do_unsolicited_passive else aconsts.PUBLISH_TYPE_SOLICITED)
 
-        # wait for for devices to synchronize with each other - used so that first
-        # discovery isn't biased by synchronization.
-        time.sleep(self.WAIT_FOR_CLUSTER)
+        # wait for the devices to synchronize with each other - used so that
+        # first discovery isn't biased by synchronization. The identity
+        # events signal that each Aware stack is up and clustering; if they
+        # do not arrive, fall back to the fixed worst-case wait.
+        try:
+            for dut in (p_dut, s_dut):
+                dut.ed.pop_event(aconsts.EVENT_CB_ON_IDENTITY_CHANGED,
+                                 self.WAIT_FOR_CLUSTER)
+        except queue.Empty:
+            remaining = self.WAIT_FOR_CLUSTER - (time.time() - start_time)
+            if remaining > 0:
+                time.sleep(remaining)
+        return {"p_dut": p_dut, "s_dut": s_dut, "p_id": p_id, "s_id": s_id}
+
+    def _measure_discovery_latency(self, results, session,
+                                   do_unsolicited_passive, dw_24ghz, dw_5ghz,
+                                   num_iterations):
+        """Measure service discovery latency on an established session.
+
+    Applies the requested DW configuration to the already formed cluster
+    and loops subscribe sessions against the running publisher, so the
+    attach and cluster formation cost is paid once per session rather
+    than once per DW combination.
+
+    Args:
+      results: Result array to be populated - will add results (not erase it)
+      session: Dict returned by _prepare_discovery_session.
+      do_unsolicited_passive: True for unsolicited/passive, False for
+                              solicited/active.
+      dw_24ghz: DW interval in the 2.4GHz band.
+      dw_5ghz: DW interval in the 5GHz band.
+      num_iterations: Number of discoveries to measure.
+    """
+        key = "%s_dw24_%d_dw5_%d" % ("unsolicited_passive"
+                                     if do_unsolicited_passive else
+                                     "solicited_active", dw_24ghz, dw_5ghz)
+        results[key] = {}
+        results[key]["num_iterations"] = num_iterations
+
+        s_dut = session["s_dut"]
+        s_id = session["s_id"]
+
+        # override the default DW configuration; when it actually changed,
+        # let the formed cluster resynchronize briefly
+        if self.config_dw_settings_on_duts((session["p_dut"], s_dut),
+                                           dw_24ghz, dw_5ghz):
+            time.sleep(self.WAIT_FOR_DW_CHANGE)
 
         # loop, perform discovery, and collect latency information
         latencies = []
@@ -214,7 +306,7 @@ class LatencyTest(AwareBaseTest):
             except queue.Empty:
                 s_dut.log.info("[Subscriber] Timed out while waiting for "
                                "SESSION_CB_ON_SERVICE_DISCOVERED")
-                failed_discoveries = failed_discoveries + 1
+                failed_discoveries += 1
                 continue
             finally:
                 # destroy subscribe
@@ -236,9 +328,29 @@ class LatencyTest(AwareBaseTest):
              "Solicited/Active", dw_24ghz, dw_5ghz))
         results[key]["num_failed_discovery"] = failed_discoveries
 
+    def run_discovery_latency(self, results, do_unsolicited_passive, dw_24ghz,
+                              dw_5ghz, num_iterations):
+        """Run the service discovery latency test with the specified DW intervals.
+
+    Args:
+      results: Result array to be populated - will add results (not erase it)
+      do_unsolicited_passive: True for unsolicited/passive, False for
+                              solicited/active.
+      dw_24ghz: DW interval in the 2.4GHz band.
+      dw_5ghz: DW interval in the 5GHz band.
+    """
+        # override the default DW configuration before the attach
+        self.config_dw_settings_on_duts(self.android_devices[0:2], dw_24ghz,
+                                        dw_5ghz)
+
+        session = self._prepare_discovery_session(do_unsolicited_passive)
+        self._measure_discovery_latency(results, session,
+                                        do_unsolicited_passive, dw_24ghz,
+                                        dw_5ghz, num_iterations)
+
         # clean up
-        p_dut.droid.wifiAwareDestroyAll()
-        s_dut.droid.wifiAwareDestroyAll()
+        session["p_dut"].droid.wifiAwareDestroyAll()
+        session["s_dut"].droid.wifiAwareDestroyAll()
 
     def run_message_latency(self, results, dw_24ghz, dw_5ghz, num_iterations):
         """Run the message tx latency test with the specified DW intervals.
@@ -256,8 +368,7 @@ class LatencyTest(AwareBaseTest):
         s_dut = self.android_devices[1]
 
         # override the default DW configuration
-        autils.config_power_settings(p_dut, dw_24ghz, dw_5ghz)
-        autils.config_power_settings(s_dut, dw_24ghz, dw_5ghz)
+        self.config_dw_settings_on_duts((p_dut, s_dut), dw_24ghz, dw_5ghz)
 
         # Start up a discovery session
         (p_id, s_id, p_disc_id, s_disc_id,
@@ -270,45 +381,58 @@ class LatencyTest(AwareBaseTest):
                  self.SERVICE_NAME, aconsts.SUBSCRIBE_TYPE_PASSIVE),
              device_startup_offset=self.device_startup_offset)
 
+        # hoist the loop-invariant lookups out of the measurement loop
+        send_message = s_dut.droid.wifiAwareSendMessage
+        s_pop_event = s_dut.ed.pop_event
+        p_pop_event = p_dut.ed.pop_event
+        latency_key = aconsts.SESSION_CB_KEY_LATENCY_MS
+        message_key = aconsts.SESSION_CB_KEY_MESSAGE_AS_STRING
+        tx_timeout = 2 * autils.EVENT_TIMEOUT
+        # format the expected message contents once, outside the loop
+        expected_messages = tuple(
+            "Message Subscriber -> Publisher #%d" % i
+            for i in range(num_iterations))
+
         latencies = []
+        sent_messages = []
         failed_tx = 0
         messages_rx = 0
         missing_rx = 0
         corrupted_rx = 0
         for i in range(num_iterations):
             # send message
-            msg_s2p = "Message Subscriber -> Publisher #%d" % i
+            msg_s2p = expected_messages[i]
             next_msg_id = self.get_next_msg_id()
-            s_dut.droid.wifiAwareSendMessage(s_disc_id, peer_id_on_sub,
-                                             next_msg_id, msg_s2p, 0)
+            send_message(s_disc_id, peer_id_on_sub, next_msg_id, msg_s2p, 0)
 
             # wait for Tx confirmation
             try:
-                sub_tx_msg_event = s_dut.ed.pop_event(
-                    aconsts.SESSION_CB_ON_MESSAGE_SENT,
-                    2 * autils.EVENT_TIMEOUT)
-                latencies.append(sub_tx_msg_event["data"][
-                    aconsts.SESSION_CB_KEY_LATENCY_MS])
+                sub_tx_msg_event = s_pop_event(
+                    aconsts.SESSION_CB_ON_MESSAGE_SENT, tx_timeout)
+                latencies.append(sub_tx_msg_event["data"][latency_key])
+                sent_messages.append(msg_s2p)
             except queue.Empty:
                 s_dut.log.info("[Subscriber] Timed out while waiting for "
                                "SESSION_CB_ON_MESSAGE_SENT")
-                failed_tx = failed_tx + 1
+                failed_tx += 1
                 continue
 
-            # wait for Rx confirmation (and validate contents)
+        # validate publisher-side reception after the Tx loop. The event
+        # dispatcher buffers the Rx events as they arrive, so draining them
+        # here overlaps the publisher-side waits with the subsequent
+        # transmissions; each message is still ACKed over the air before
+        # the next one is sent.
+        for msg_s2p in sent_messages:
             try:
-                pub_rx_msg_event = p_dut.ed.pop_event(
-                    aconsts.SESSION_CB_ON_MESSAGE_RECEIVED,
-                    2 * autils.EVENT_TIMEOUT)
-                messages_rx = messages_rx + 1
-                if (pub_rx_msg_event["data"]
-                    [aconsts.SESSION_CB_KEY_MESSAGE_AS_STRING] != msg_s2p):
-                    corrupted_rx = corrupted_rx + 1
+                pub_rx_msg_event = p_pop_event(
+                    aconsts.SESSION_CB_ON_MESSAGE_RECEIVED, tx_timeout)
+                messages_rx += 1
+                if pub_rx_msg_event["data"][message_key] != msg_s2p:
+                    corrupted_rx += 1
             except queue.Empty:
-                s_dut.log.info("[Publisher] Timed out while waiting for "
+                p_dut.log.info("[Publisher] Timed out while waiting for "
                                "SESSION_CB_ON_MESSAGE_RECEIVED")
-                missing_rx = missing_rx + 1
-                continue
+                missing_rx += 1
 
         autils.extract_stats(
             s_dut,
@@ -346,8 +470,8 @@ class LatencyTest(AwareBaseTest):
         resp_dut.pretty_name = 'Responder'
 
         # override the default DW configuration
-        autils.config_power_settings(init_dut, dw_24ghz, dw_5ghz)
-        autils.config_power_settings(resp_dut, dw_24ghz, dw_5ghz)
+        self.config_dw_settings_on_duts((init_dut, resp_dut), dw_24ghz,
+                                        dw_5ghz)
 
         # Initiator+Responder: attach and wait for confirmation & identity
         init_id = init_dut.droid.wifiAwareAttach(True)
@@ -464,8 +588,7 @@ class LatencyTest(AwareBaseTest):
         s_dut.pretty_name = "Subscriber"
 
         # override the default DW configuration
-        autils.config_power_settings(p_dut, dw_24ghz, dw_5ghz)
-        autils.config_power_settings(s_dut, dw_24ghz, dw_5ghz)
+        self.config_dw_settings_on_duts((p_dut, s_dut), dw_24ghz, dw_5ghz)
 
         latencies = []
 
@@ -717,18 +840,72 @@ class LatencyTest(AwareBaseTest):
             "test_discovery_latency_non_interactive_dws finished",
             extras=results)
 
+    def _sample_dw_pairs(self, dw24_values, dw5_values):
+        """Select the (dw24, dw5) combinations to run.
+
+    By default returns a sample of the grid in which every permitted value
+    of each band appears at least once, rather than the full Cartesian
+    product - each discovery session is bounded by real DW radio intervals,
+    so the full grid is very expensive. Set the 'exhaustive_dw_grid' user
+    param to run every combination.
+
+    Args:
+      dw24_values: Permitted DW intervals in the 2.4GHz band.
+      dw5_values: Permitted DW intervals in the 5GHz band.
+
+    Returns:
+      List of (dw_24ghz, dw_5ghz) tuples to test.
+    """
+        if self.user_params.get("exhaustive_dw_grid", False):
+            return list(itertools.product(dw24_values, dw5_values))
+        if len(dw24_values) < len(dw5_values):
+            return list(zip(itertools.cycle(dw24_values), dw5_values))
+        return list(zip(dw24_values, itertools.cycle(dw5_values)))
+
     def test_discovery_latency_all_dws(self):
-        """Measure the service discovery latency with all DW combinations (low
-    iteration count)"""
+        """Measure the service discovery latency over the DW combinations (low
+    iteration count). By default a covering sample of the grid is run - set
+    the 'exhaustive_dw_grid' user param to run all combinations. Iteration
+    stops early once every DW value of each band has accumulated
+    'dw_coverage_target' passing samples."""
         results = {}
-        for dw24 in range(1, 6):  # permitted values: 1-5
-            for dw5 in range(0, 6):  # permitted values: 0, 1-5
-                self.run_discovery_latency(
-                    results=results,
-                    do_unsolicited_passive=True,
-                    dw_24ghz=dw24,
-                    dw_5ghz=dw5,
-                    num_iterations=10)
+        num_iterations = 10
+        coverage_target = self.user_params.get("dw_coverage_target",
+                                               num_iterations)
+        pairs = self._sample_dw_pairs(
+            list(range(1, 6)),  # permitted values: 1-5
+            list(range(0, 6)))  # permitted values: 0, 1-5
+        # iterate in a shuffled but reproducible order, so the early-exit
+        # criterion sees every DW value as soon as possible
+        random.Random(self.user_params.get("dw_grid_seed", 0)).shuffle(pairs)
+        dw24_values = {dw24 for dw24, _ in pairs}
+        dw5_values = {dw5 for _, dw5 in pairs}
+        dw24_covered = collections.Counter()
+        dw5_covered = collections.Counter()
+        # the attach + publish + cluster formation is reused across the
+        # grid; only the DW configuration changes between measurements
+        session = self._prepare_discovery_session(do_unsolicited_passive=True)
+        for dw24, dw5 in pairs:
+            self._measure_discovery_latency(
+                results=results,
+                session=session,
+                do_unsolicited_passive=True,
+                dw_24ghz=dw24,
+                dw_5ghz=dw5,
+                num_iterations=num_iterations)
+            key = "unsolicited_passive_dw24_%d_dw5_%d" % (dw24, dw5)
+            passing = num_iterations - results[key]["num_failed_discovery"]
+            dw24_covered[dw24] += passing
+            dw5_covered[dw5] += passing
+            # once every DW value of each band has enough passing samples,
+            # additional combinations add little information
+            if (all(dw24_covered[value] >= coverage_target
+                    for value in dw24_values)
+                    and all(dw5_covered[value] >= coverage_target
+                            for value in dw5_values)):
+                break
+        session["p_dut"].droid.wifiAwareDestroyAll()
+        session["s_dut"].droid.wifiAwareDestroyAll()
         asserts.explicit_pass(
             "test_discovery_latency_all_dws finished", extras=results)
 